@@ -0,0 +1,67 @@
+"""Non-blocking widget animations.
+
+Animations are lists of keyframes scheduled with ``root.after`` on the Tk
+main thread, so they never sleep or block the timer. Each animation has a
+name; starting an animation with a name that is already playing replaces
+it, and animations can be cancelled (for example when the timer is reset).
+"""
+
+
+class Animator:
+    """Plays named keyframe animations on the Tk main thread.
+
+    A keyframe is a ``(delay_ms, func)`` pair: ``func`` is called
+    ``delay_ms`` milliseconds after the previous keyframe. All methods must
+    be called from the main thread.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.playing = {}  # name -> (after id, on_stop)
+
+    def play(self, name, keyframes, on_stop=None):
+        """Start the animation ``name``, replacing any running one.
+
+        ``on_stop`` is called once when the animation finishes or is
+        cancelled, e.g. to restore the widget's original look.
+        """
+        self.cancel(name)
+        self._schedule(name, iter(keyframes), on_stop)
+
+    def _schedule(self, name, keyframes, on_stop):
+        try:
+            delay_ms, func = next(keyframes)
+        except StopIteration:
+            self.playing.pop(name, None)
+            if on_stop:
+                on_stop()
+            return
+
+        def step():
+            func()
+            self._schedule(name, keyframes, on_stop)
+
+        self.playing[name] = (self.root.after(delay_ms, step), on_stop)
+
+    def cancel(self, name):
+        """Stop the animation ``name`` if it is running"""
+        if name not in self.playing:
+            return
+        after_id, on_stop = self.playing.pop(name)
+        self.root.after_cancel(after_id)
+        if on_stop:
+            on_stop()
+
+    def cancel_all(self):
+        """Stop all running animations"""
+        for name in list(self.playing):
+            self.cancel(name)
+
+
+def blink_keyframes(widget, on_options, off_options, times=3, interval_ms=300):
+    """Keyframes that switch ``widget`` between two sets of options"""
+    keyframes = []
+    for _ in range(times):
+        keyframes.append((0 if not keyframes else interval_ms, lambda: widget.configure(**on_options)))
+        keyframes.append((interval_ms, lambda: widget.configure(**off_options)))
+    return keyframes
@@ -0,0 +1,196 @@
+"""asyncio runtime mode.
+
+With ``--wakeup asyncio`` the application runs on a single asyncio event
+loop instead of Tk's ``mainloop`` plus worker threads: Tk is pumped
+cooperatively by a coroutine, the timer scheduler waits for its deadlines
+and commands in a coroutine, and notifications are sent from tasks. Every
+engine event and widget update therefore happens on the one main thread,
+with no cross-thread hand-off.
+
+Tk is pumped with ``dooneevent`` whenever its X server connection is
+readable (``loop.add_reader``) or the application has queued Tk work. Tk
+timers (``after``) are invisible to asyncio, so only while some are pending
+does the pump also poll, at a short interval that grows while the window is
+idle. Without an X11 display connection (other windowing systems) it always
+polls.
+"""
+
+import asyncio
+import tkinter as tk
+
+import _tkinter
+
+from notifications import default_notifier
+from scheduler import STOP
+
+# Pump interval while events keep arriving, and the idle back-off limit
+PUMP_ACTIVE_SECONDS = 0.005
+PUMP_IDLE_SECONDS = 0.05
+
+
+def display_fd(root):
+    """File descriptor of Tk's X server connection, or ``None``"""
+    if root.tk.call("tk", "windowingsystem") != "x11":
+        return None
+    try:
+        import ctypes
+        library = ctypes.CDLL(_tkinter.__file__)  # Resolves libtk and libX11 symbols too
+        library.Tk_MainWindow.argtypes = [ctypes.c_void_p]
+        library.Tk_MainWindow.restype = ctypes.c_void_p
+        library.XConnectionNumber.argtypes = [ctypes.c_void_p]
+        window = library.Tk_MainWindow(root.tk.interpaddr())
+        if not window:
+            return None
+        # The display is the first field of every Tk_Window (Tk_FakeWin in tk.h)
+        display = ctypes.c_void_p.from_address(window).value
+        return library.XConnectionNumber(display)
+    except (OSError, AttributeError) as e:
+        print(f"Error finding the X display connection, polling Tk instead: {e}")
+        return None
+
+
+class AsyncRuntime:
+    """Runs Tk and the application coroutines on one asyncio loop"""
+
+    def __init__(self, root):
+        self.root = root
+        self.coroutines = []
+        self.running = False
+        self.woken = None  # Set when Tk has events or work to process
+
+    def spawn(self, coroutine_function):
+        """Run ``coroutine_function()`` as a task once the loop starts"""
+        self.coroutines.append(coroutine_function)
+
+    def run(self):
+        """Run until the Tk window is destroyed"""
+        asyncio.run(self.main())
+
+    def wake(self):
+        """Have the pump process Tk events, e.g. after queueing widget updates"""
+        if self.woken is not None:
+            self.woken.set()
+
+    async def main(self):
+        self.running = True
+        self.woken = asyncio.Event()
+        tasks = [asyncio.create_task(function()) for function in self.coroutines]
+        try:
+            await self.pump_tk()
+        finally:
+            self.running = False
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def pump_tk(self):
+        """Process Tk events cooperatively until the window is destroyed"""
+        loop = asyncio.get_running_loop()
+        fd = display_fd(self.root)
+        if fd is not None:
+            loop.add_reader(fd, self.wake)
+        try:
+            interval = PUMP_ACTIVE_SECONDS
+            while True:
+                self.woken.clear()
+                processed = 0
+                while self.root.tk.dooneevent(_tkinter.DONT_WAIT):
+                    processed += 1
+                try:
+                    self.root.winfo_exists()
+                except tk.TclError:
+                    break  # Window destroyed
+                if processed:
+                    interval = PUMP_ACTIVE_SECONDS
+                else:
+                    interval = min(interval * 2, PUMP_IDLE_SECONDS)
+                # Poll only while Tk timers are pending (or without a display fd)
+                timeout = interval
+                if fd is not None and not self.root.tk.call("after", "info"):
+                    timeout = None
+                try:
+                    await asyncio.wait_for(self.woken.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if fd is not None:
+                loop.remove_reader(fd)
+
+
+class AsyncSchedulerDriver:
+    """Drive a ``TimerScheduler`` from a coroutine.
+
+    Offers the same ``start``/``send``/``stop`` interface as the scheduler's
+    worker thread, but must only be used from the event loop thread.
+    """
+
+    def __init__(self, runtime, scheduler):
+        self.runtime = runtime
+        self.scheduler = scheduler
+        self.commands = asyncio.Queue()
+
+    def start(self):
+        self.runtime.spawn(self.run)
+
+    def send(self, command):
+        self.commands.put_nowait(command)
+
+    def stop(self, timeout=None):
+        self.commands.put_nowait(STOP)
+
+    async def run(self):
+        """Wait for the next deadline or command, then step the scheduler"""
+        scheduler = self.scheduler
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0, deadline - scheduler.clock.monotonic())
+            try:
+                command = await asyncio.wait_for(self.commands.get(), timeout)
+            except asyncio.TimeoutError:
+                command = None
+                scheduler.lateness.add(scheduler.clock.monotonic() - deadline)
+            if command == STOP:
+                break
+            deadline = scheduler.safe_step(command)
+            self.runtime.wake()  # Listeners may have queued widget updates
+
+
+class AsyncNotifier:
+    """Send notifications from asyncio tasks.
+
+    The blocking backend runs in the default executor with a timeout, and
+    identical notifications that are still being sent are dropped.
+    """
+
+    def __init__(self, notify=None, timeout=5.0):
+        self.notify = notify
+        self.timeout = timeout
+        self.pending = set()
+        self.tasks = set()
+
+    def post(self, title, message):
+        key = (title, message)
+        if key in self.pending:
+            return False
+        self.pending.add(key)
+        task = asyncio.get_running_loop().create_task(self.send(key))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return True
+
+    async def send(self, key):
+        loop = asyncio.get_running_loop()
+        try:
+            if self.notify is None:
+                self.notify = await loop.run_in_executor(None, default_notifier)
+            await asyncio.wait_for(loop.run_in_executor(None, self.notify, *key), self.timeout)
+        except asyncio.TimeoutError:
+            print(f"Notification timed out after {self.timeout}s")
+        except Exception as e:
+            print(f"Notification error: {e}")
+        finally:
+            self.pending.discard(key)
+
+    def close(self, timeout=None):
+        for task in list(self.tasks):
+            task.cancel()
@@ -0,0 +1,86 @@
+"""Reading the session history: JSON-lines log vs binary archive.
+
+Writes the same synthetic sessions (ten years) as a session log and as an
+archive, then times a whole-history scan (focus time of completed work
+sessions) over each:
+
+* parsing the JSON-lines log and folding it into sessions,
+* unpacking the archive records in Python (no NumPy),
+* mapping the archive as a NumPy array and summing vectorized.
+
+    python benchmarks/bench_archive.py [sessions]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import session_archive  # noqa: E402
+from bench_history_store import sessions  # noqa: E402
+from session_log import SessionFolder, read_events  # noqa: E402
+from timer_engine import WORK  # noqa: E402
+
+
+def write_log(path, count):
+    with open(path, "w", encoding="utf-8") as f:
+        for start, end, timer_type, task, planned, actual, pauses, completed in sessions(count):
+            f.write(json.dumps({"event": "start", "wall": start, "type": timer_type, "planned": planned,
+                                "actual": 0, "task": task}) + "\n")
+            for _ in range(pauses):
+                f.write(json.dumps({"event": "pause", "wall": start, "type": timer_type, "planned": planned,
+                                    "actual": 0}) + "\n")
+            f.write(json.dumps({"event": "complete" if completed else "reset", "wall": end, "type": timer_type,
+                                "planned": planned, "actual": actual}) + "\n")
+
+
+def scan_log(path):
+    total = 0
+    for start, end, timer_type, task, planned, actual, pauses, completed in SessionFolder().feed(read_events(path)):
+        if completed and timer_type == WORK:
+            total += actual
+    return total
+
+
+def scan_records(path):
+    work = session_archive.TYPE_CODES[WORK]
+    total = 0
+    for start, duration, planned, task, timer_type, completed, pauses in session_archive.iter_archive(path):
+        if completed and timer_type == work:
+            total += duration
+    return total
+
+
+def scan_numpy(path):
+    records = session_archive.load_archive(path)
+    mask = (records["type"] == session_archive.TYPE_CODES[WORK]) & (records["completed"] == 1)
+    return int(records["duration"][mask].sum(dtype="u8"))
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        log_path = os.path.join(directory, "sessions.jsonl")
+        archive_path = os.path.join(directory, "sessions.pomarc")
+        write_log(log_path, count)
+        seconds, written = timed(session_archive.convert_log, log_path, archive_path)
+        print(f"convert {written} sessions: {seconds:.2f} s "
+              f"(log {os.path.getsize(log_path) / 1e6:.0f} MB, archive {os.path.getsize(archive_path) / 1e6:.0f} MB)")
+
+        scans = [
+            ("JSON-lines log", scan_log, log_path),
+            ("archive, struct", scan_records, archive_path),
+            ("archive, numpy", scan_numpy, archive_path)
+        ]
+        for name, scan, path in scans:
+            seconds, total = timed(scan, path)
+            print(f"{name:<16} {seconds * 1000:9.1f} ms  (focus {total / 3600:,.0f} h)")
@@ -0,0 +1,34 @@
+"""Per-tick cost of formatting the timer display.
+
+Compares formatting with divmods and an f-string on every tick with a
+lookup in the precomputed ``TimeStringTable``.
+
+    python benchmarks/bench_format_time.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from time_format import FORMATS, FORMATTERS, TimeStringTable  # noqa: E402
+
+SESSION = 25 * 60
+NUMBER = 200
+
+
+def bench(label, func):
+    seconds = range(SESSION, -1, -1)
+    elapsed = timeit.timeit(lambda: [func(s) for s in seconds], number=NUMBER)
+    per_tick = elapsed / (NUMBER * (SESSION + 1)) * 1e9
+    print(f"{label:<28} {per_tick:8.1f} ns/tick")
+
+
+if __name__ == "__main__":
+    for display_format in FORMATS:
+        table = TimeStringTable(SESSION, display_format)
+        bench(f"{display_format} f-string", FORMATTERS[display_format])
+        bench(f"{display_format} table", table.format)
+    build = timeit.timeit(lambda: TimeStringTable(SESSION), number=20) / 20
+    print(f"building a {SESSION + 1}-entry table: {build * 1000:.2f} ms")
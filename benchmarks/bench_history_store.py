@@ -0,0 +1,79 @@
+"""SQLite session history: bulk insert and 90-day summary.
+
+Inserts synthetic sessions spread over ten years into a fresh database in
+batches (one transaction per batch, as the session log writer does), then
+times the 90-day summaries by day, week and task, computed from the
+sessions and read from the incrementally maintained rollups.
+
+    python benchmarks/bench_history_store.py [sessions] [batch]
+"""
+
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from history_store import HistoryStore  # noqa: E402
+from timer_engine import WORK, SHORT_BREAK, LONG_BREAK, DEFAULT_DURATIONS  # noqa: E402
+
+YEARS = 10
+TASKS = [None, "email", "review", "writing", "planning"]
+
+
+def sessions(count):
+    rng = random.Random(42)
+    end = time.time()
+    start = end - YEARS * 365 * 86400
+    step = (end - start) / count
+    types = [WORK, WORK, SHORT_BREAK, LONG_BREAK]
+    for i in range(count):
+        timer_type = types[i % 4]
+        planned = DEFAULT_DURATIONS[timer_type]
+        completed = rng.random() < 0.85
+        actual = planned if completed else rng.randrange(planned)
+        begin = start + i * step
+        yield (begin, begin + actual, timer_type, rng.choice(TASKS), planned, actual, rng.randrange(3), completed)
+
+
+def best_of(function, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    with tempfile.TemporaryDirectory() as directory:
+        store = HistoryStore(os.path.join(directory, "history.sqlite3"))
+        start = time.perf_counter()
+        pending = []
+        for session in sessions(count):
+            pending.append(session)
+            if len(pending) == batch:
+                store.add_sessions(pending)
+                pending = []
+        store.add_sessions(pending)
+        elapsed = time.perf_counter() - start
+        print(f"insert {count} sessions in batches of {batch}: {elapsed:.2f} s "
+              f"({count / elapsed:,.0f} sessions/s, {store.transactions} transactions)")
+
+        today = datetime.date.today().toordinal()
+        for by in ("day", "week", "task"):
+            seconds, rows = best_of(lambda: store.summary(90, by, today))
+            print(f"90-day summary by {by}: {seconds * 1000:.1f} ms ({len(rows)} rows)")
+        for by, first in (("day", today - 89), ("week", today - 89), ("task", None)):
+            seconds, rows = best_of(lambda: store.totals(by, first))
+            print(f"rollup totals by {by}: {seconds * 1000:.2f} ms ({len(rows)} rows)")
+        seconds, streak = best_of(lambda: store.streak(today))
+        print(f"streak {streak}: {seconds * 1000:.2f} ms")
+        seconds, problems = best_of(store.check_rollups, repeat=1)
+        print(f"rollup consistency check: {seconds:.2f} s ({len(problems)} problems)")
+        store.close()
@@ -0,0 +1,44 @@
+"""Throughput of the simulated timer.
+
+Simulates 8-hour days of back-to-back sessions and reports the time per
+simulated day and the number of engine transitions per second.
+
+    python benchmarks/bench_simulation.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation import Simulation  # noqa: E402
+from timer_engine import TimerEngine  # noqa: E402
+
+DAY = 8 * 3600
+
+
+def bench_day(ticks, days):
+    started = time.perf_counter()
+    events = 0
+    for _ in range(days):
+        simulation = Simulation(auto_start=True, ticks=ticks)
+        events += len(simulation.run([(0, "start", None)], DAY))
+    elapsed = time.perf_counter() - started
+    mode = "every second" if ticks else "jump to deadlines"
+    print(f"8 h day ({mode}): {elapsed / days * 1000:8.3f} ms/day, {events / elapsed:12,.0f} events/s")
+
+
+def bench_transitions(count):
+    engine = TimerEngine()
+    started = time.perf_counter()
+    for _ in range(count):
+        engine.complete()
+    elapsed = time.perf_counter() - started
+    print(f"engine.complete():               {count / elapsed:12,.0f} transitions/s")
+
+
+if __name__ == "__main__":
+    bench_day(ticks=False, days=200)
+    bench_day(ticks=True, days=5)
+    bench_transitions(1_000_000)
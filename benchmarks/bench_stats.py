@@ -0,0 +1,42 @@
+"""Dashboard statistics over ten years of history.
+
+Writes synthetic sessions spread over ten years to an archive, then times
+mapping the archive and computing every dashboard figure with
+``SessionStats``. The default of 120,000 sessions is about 16 work
+sessions and their breaks every day.
+
+    python benchmarks/bench_stats.py [sessions]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import session_archive  # noqa: E402
+from bench_history_store import sessions  # noqa: E402
+from session_stats import SessionStats  # noqa: E402
+
+
+def dashboard(path):
+    return SessionStats.from_archive(path).dashboard()
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 120_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sessions.pomarc")
+        session_archive.write_archive(path, sessions(count))
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            figures = dashboard(path)
+            best = min(best, time.perf_counter() - start)
+        print(f"dashboard for {count} sessions: {best * 1000:.1f} ms")
+        print(f"  days {len(figures['daily'][0])}, weeks {len(figures['weekly'][0])}, "
+              f"months {len(figures['monthly'][0])}")
+        print(f"  completion rate {figures['completion_rate']:.1%}, "
+              f"average pauses {figures['average_pauses']:.2f}, best hour {figures['best_hour']}")
+        print(f"  streaks: current {figures['current_streak']}, longest {figures['longest_streak']}")
@@ -0,0 +1,76 @@
+"""Deadline wakeup lateness of the timer backends.
+
+Compares how late the process wakes up after a deadline with:
+
+* the original polling loop (check every 50 ms),
+* the scheduler thread (queue wait with a timeout),
+* a timerfd armed for the exact deadline (Linux only).
+
+    python benchmarks/bench_wakeup_lateness.py [wakeups]
+"""
+
+import os
+import queue
+import random
+import select
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scheduler import LatenessHistogram  # noqa: E402
+import timerfd_backend  # noqa: E402
+
+
+def deadlines(count):
+    rng = random.Random(42)
+    now = time.monotonic() + 0.01
+    for _ in range(count):
+        now += rng.uniform(0.02, 0.12)
+        yield now
+
+
+def bench_polling(count):
+    histogram = LatenessHistogram()
+    for deadline in deadlines(count):
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+        histogram.add(time.monotonic() - deadline)
+    return histogram
+
+
+def bench_queue(count):
+    histogram = LatenessHistogram()
+    commands = queue.Queue()
+    for deadline in deadlines(count):
+        try:
+            commands.get(timeout=max(0, deadline - time.monotonic()))
+        except queue.Empty:
+            pass
+        histogram.add(time.monotonic() - deadline)
+    return histogram
+
+
+def bench_timerfd(count):
+    histogram = LatenessHistogram()
+    timerfd = timerfd_backend.TimerFD()
+    try:
+        for deadline in deadlines(count):
+            timerfd.arm(deadline)
+            select.select([timerfd], [], [])
+            timerfd.read()
+            histogram.add(time.monotonic() - deadline)
+    finally:
+        timerfd.close()
+    return histogram
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    backends = [("polling loop (50 ms)", bench_polling), ("scheduler thread", bench_queue)]
+    if timerfd_backend.is_available():
+        backends.append(("timerfd", bench_timerfd))
+    for name, bench in backends:
+        print(f"{name}:")
+        print(bench(count).format())
+        print()
@@ -0,0 +1,75 @@
+"""Clocks used by the timer scheduler.
+
+The scheduler measures elapsed time with a monotonic clock, so NTP
+adjustments or manual changes of the system time never distort the
+remaining time. A second, boot-time clock that keeps running while the
+machine is suspended is used to detect suspend; the wall clock is only
+used for logging.
+
+``FakeClock`` implements the same interface with manually advanced time so
+the scheduler can be driven at simulated speed.
+"""
+
+import time
+
+# What happens to a running timer across a system suspend
+SUSPEND_CONTINUE = "continue"  # Suspended time counts, like a kitchen timer
+SUSPEND_FREEZE = "freeze"  # Suspended time does not count
+SUSPEND_PAUSE = "pause"  # Suspended time does not count and the timer is paused
+
+SUSPEND_POLICIES = (SUSPEND_CONTINUE, SUSPEND_FREEZE, SUSPEND_PAUSE)
+
+# Gaps between the two clocks shorter than this are not treated as suspend
+SUSPEND_THRESHOLD = 1.0
+
+
+class SystemClock:
+    """The real clocks of the machine.
+
+    ``monotonic`` does not advance while suspended on Linux and macOS.
+    ``boottime`` uses CLOCK_BOOTTIME where available (Linux); elsewhere it
+    falls back to the monotonic clock, which disables suspend detection.
+    """
+
+    def __init__(self):
+        self.boottime_id = getattr(time, "CLOCK_BOOTTIME", None)
+
+    def monotonic(self):
+        """Seconds from an arbitrary point, never going backwards"""
+        return time.monotonic_ns() / 1e9
+
+    def boottime(self):
+        """Like ``monotonic`` but also counting time spent suspended"""
+        if self.boottime_id is not None:
+            return time.clock_gettime_ns(self.boottime_id) / 1e9
+        return self.monotonic()
+
+    def wall(self):
+        """Wall clock time (for logging only)"""
+        return time.time()
+
+
+class FakeClock:
+    """Manually advanced clock for simulations and benchmarks"""
+
+    def __init__(self, start=0.0, wall_start=0.0):
+        self.now = start
+        self.suspended = 0.0
+        self.wall_offset = wall_start - start
+
+    def monotonic(self):
+        return self.now
+
+    def boottime(self):
+        return self.now + self.suspended
+
+    def wall(self):
+        return self.now + self.suspended + self.wall_offset
+
+    def advance(self, seconds):
+        """Let ``seconds`` of running time pass"""
+        self.now += seconds
+
+    def suspend(self, seconds):
+        """Simulate the machine being suspended for ``seconds``"""
+        self.suspended += seconds
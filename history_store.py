@@ -0,0 +1,220 @@
+"""SQLite storage for preferences and session history.
+
+One database file holds the preferences (as JSON values by key) and one row
+per finished session, so that history can be summarised by day, week,
+timer type and task. The database runs in WAL mode, so a reader (a report)
+never blocks the writer. Statements are parameterised constants, which
+sqlite3 keeps prepared in its statement cache, and each batch of sessions is
+inserted with ``executemany`` in a single transaction.
+
+Sessions are usually fed from the ``SessionLog`` writer thread: its batches
+of transition records are folded into sessions by ``add_events``. The
+rollups (see ``rollups.py``) are updated in the same transaction. History
+written before rollups existed gets them from ``build_rollups``, which the
+writer thread runs first; until then totals and streaks are computed from
+the sessions.
+"""
+
+import datetime
+import json
+import sqlite3
+import threading
+
+import rollups
+from session_log import SessionFolder
+
+HISTORY_FILE = "history.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS preferences (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    start REAL NOT NULL,        -- Wall clock time the timer was started
+    end REAL NOT NULL,          -- Wall clock time it completed or was reset
+    day INTEGER NOT NULL,       -- Local date of start, as a date ordinal
+    type TEXT NOT NULL,
+    task TEXT,
+    planned INTEGER NOT NULL,   -- Seconds
+    actual INTEGER NOT NULL,    -- Seconds the timer ran (pauses excluded)
+    pauses INTEGER NOT NULL,
+    completed INTEGER NOT NULL  -- 1 if completed, 0 if reset
+);
+CREATE INDEX IF NOT EXISTS sessions_start ON sessions (start);
+CREATE INDEX IF NOT EXISTS sessions_type ON sessions (type, start);
+"""
+
+INSERT_SESSION = (
+    "INSERT INTO sessions (start, end, day, type, task, planned, actual, pauses, completed) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+UPSERT_PREFERENCE = (
+    "INSERT INTO preferences (key, value) VALUES (?, ?) "
+    "ON CONFLICT (key) DO UPDATE SET value = excluded.value"
+)
+SELECT_PREFERENCES = "SELECT key, value FROM preferences"
+NEEDS_ROLLUPS = "SELECT EXISTS (SELECT 1 FROM sessions) AND NOT EXISTS (SELECT 1 FROM rollup_day)"
+
+# Grouping key of each summary; weeks start on Monday (ordinal 1 is a Monday)
+SUMMARY_PERIODS = {
+    "day": "day",
+    "week": "day - (day - 1) % 7",
+    "task": "task"
+}
+# Rollup rows computed from the sessions while the rollups are not built
+SESSION_TOTALS_SQL = (
+    "SELECT {expression} AS {key}, type, COUNT(*), SUM(completed), SUM(actual), SUM(pauses) "
+    "FROM sessions GROUP BY 1, type"
+)
+SUMMARY_SQL = (
+    "SELECT {period} AS period, type, COUNT(*), SUM(completed), SUM(actual), SUM(pauses) "
+    "FROM sessions WHERE start >= ? AND start < ? "
+    "GROUP BY period, type ORDER BY period, type"
+)
+
+
+def local_day(timestamp):
+    """Local date of a wall clock timestamp, as a date ordinal"""
+    return datetime.date.fromtimestamp(timestamp).toordinal()
+
+
+def day_start(ordinal):
+    """Wall clock timestamp of local midnight starting the given day"""
+    date = datetime.date.fromordinal(ordinal)
+    return datetime.datetime(date.year, date.month, date.day).timestamp()
+
+
+class HistoryStore:
+    """Session history and preferences in a SQLite database.
+
+    Safe to use from several threads; calls are serialised by a lock.
+    """
+
+    def __init__(self, path=HISTORY_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        rollups.create(self.connection)
+        # History written before rollups existed needs build_rollups
+        self.rollups_ready = not self.connection.execute(NEEDS_ROLLUPS).fetchone()[0]
+        self.folder = SessionFolder()  # Sessions still running in add_events
+
+        # Instrumentation
+        self.sessions_inserted = 0
+        self.transactions = 0
+
+    def read_preferences(self):
+        """Saved preferences, or ``None`` if none were ever saved"""
+        with self.lock:
+            rows = self.connection.execute(SELECT_PREFERENCES).fetchall()
+        if not rows:
+            return None
+        return {key: json.loads(value) for key, value in rows}
+
+    def write_preferences(self, values):
+        """Save all preferences in one transaction"""
+        with self.lock, self.connection:
+            self.connection.executemany(
+                UPSERT_PREFERENCE, [(key, json.dumps(value)) for key, value in values.items()]
+            )
+            self.transactions += 1
+
+    def add_sessions(self, sessions):
+        """Insert finished sessions in one transaction.
+
+        Each session is a ``(start, end, type, task, planned, actual, pauses,
+        completed)`` tuple with wall clock ``start``/``end``.
+        """
+        rows = [
+            (start, end, local_day(start), timer_type, task, planned, actual, pauses, int(completed))
+            for start, end, timer_type, task, planned, actual, pauses, completed in sessions
+        ]
+        if not rows:
+            return
+        with self.lock, self.connection:
+            self.connection.executemany(INSERT_SESSION, rows)
+            if self.rollups_ready:
+                rollups.apply(self.connection, rows)  # Otherwise build_rollups counts them
+            self.sessions_inserted += len(rows)
+            self.transactions += 1
+
+    def add_events(self, records):
+        """Fold ``SessionLog`` records into sessions and insert the finished ones"""
+        finished = self.folder.feed(records)
+        self.add_sessions(finished)
+
+    def summary(self, days=90, by="day", last_day=None):
+        """Totals per period and timer type over the last ``days`` days.
+
+        ``by`` is ``"day"``, ``"week"`` or ``"task"``. Returns
+        ``(period, type, sessions, completed, focus_seconds, pauses)`` rows,
+        with ``period`` a ``datetime.date`` (the Monday for weeks) or the
+        task name.
+        """
+        if last_day is None:
+            last_day = datetime.date.today().toordinal()
+        sql = SUMMARY_SQL.format(period=SUMMARY_PERIODS[by])
+        with self.lock:
+            rows = self.connection.execute(sql, (day_start(last_day - days + 1), day_start(last_day + 1))).fetchall()
+        if by == "task":
+            return rows
+        return [(datetime.date.fromordinal(row[0]),) + row[1:] for row in rows]
+
+    def totals(self, by="day", first=None):
+        """Rollup totals per ``"day"``, ``"week"`` or ``"task"`` and timer
+        type, as ``(key, type, sessions, completed, focus_seconds, pauses)``
+        rows; ``first`` is the first day or week ordinal to include"""
+        table = f"rollup_{by}"
+        key, expression = rollups.TABLES[table]
+        with self.lock:
+            if self.rollups_ready:
+                sql = rollups.SELECT_SQL.format(table=table, key=key)
+            else:
+                # Scan the sessions, like summary(), until the rollups are built
+                sql = SESSION_TOTALS_SQL.format(key=key, expression=expression)
+            parameters = ()
+            if first is not None and by != "task":
+                sql = f"SELECT * FROM ({sql}) WHERE {key} >= ?"
+                parameters = (first,)
+            return self.connection.execute(sql + f" ORDER BY {key}, type", parameters).fetchall()
+
+    def streak(self, today=None):
+        """``(current, longest)`` streaks of days with a completed work
+        session; the current streak may end today or yesterday"""
+        if today is None:
+            today = datetime.date.today().toordinal()
+        with self.lock:
+            if self.rollups_ready:
+                row = self.connection.execute(rollups.SELECT_STREAK).fetchone()
+            else:
+                row = rollups.recompute_streak(self.connection)
+        if row is None or row[0] is None:
+            return 0, 0
+        last_day, current, longest = row
+        return (current if last_day >= today - 1 else 0), longest
+
+    def build_rollups(self):
+        """Build the rollups of history written before they existed (slow on
+        a large history, so not run on the main thread)"""
+        with self.lock:
+            if not self.rollups_ready:
+                rollups.rebuild(self.connection)
+                self.rollups_ready = True
+
+    def rebuild_rollups(self):
+        with self.lock:
+            rollups.rebuild(self.connection)
+            self.rollups_ready = True
+
+    def check_rollups(self):
+        with self.lock:
+            return rollups.check(self.connection)
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
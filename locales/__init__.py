@@ -0,0 +1 @@
+"""UI strings, one module per language (``locales.<code>.strings``)."""
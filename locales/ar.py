@@ -0,0 +1,21 @@
+strings = {
+    "app_title": "مؤقت بومودورو",
+    "work_session": "جلسة العمل",
+    "break_session": "استراحة",
+    "long_break_session": "استراحة طويلة",
+    "sessions": "الجلسات",
+    "start": "بدء",
+    "pause": "إيقاف مؤقت",
+    "reset": "إعادة تعيين",
+    "settings": "الإعدادات",
+    "theme": "السمة:",
+    "volume": "الصوت:",
+    "language": "اللغة:",
+    "shortcuts": "اختصارات لوحة المفاتيح: مسافة (بدء/إيقاف مؤقت)، R (إعادة تعيين)",
+    "session_complete": "اكتملت الجلسة!",
+    "take_break": "حان وقت الاستراحة!",
+    "back_to_work": "حان وقت العودة إلى العمل!",
+    "resume": "استئناف",
+    "confirm_exit_title": "خروج؟",
+    "confirm_exit_message": "المؤقت قيد التشغيل. هل تريد الخروج حقًا؟"
+}
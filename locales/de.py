@@ -0,0 +1,21 @@
+strings = {
+    "app_title": "Pomodoro Timer",
+    "work_session": "ARBEITSSITZUNG",
+    "break_session": "PAUSE",
+    "long_break_session": "LANGE PAUSE",
+    "sessions": "Sitzungen",
+    "start": "Start",
+    "pause": "Pause",
+    "reset": "Zurücksetzen",
+    "settings": "Einstellungen",
+    "theme": "Thema:",
+    "volume": "Lautstärke:",
+    "language": "Sprache:",
+    "shortcuts": "Tastenkombinationen: Leertaste (Start/Pause), R (Zurücksetzen)",
+    "session_complete": "Sitzung beendet!",
+    "take_break": "Zeit für eine Pause!",
+    "back_to_work": "Zeit, wieder an die Arbeit zu gehen!",
+    "resume": "Fortsetzen",
+    "confirm_exit_title": "Beenden?",
+    "confirm_exit_message": "Ein Timer läuft. Möchten Sie wirklich beenden?"
+}
@@ -0,0 +1,21 @@
+strings = {
+    "app_title": "Pomodoro Timer",
+    "work_session": "WORK SESSION",
+    "break_session": "BREAK SESSION",
+    "long_break_session": "LONG BREAK",
+    "sessions": "Sessions",
+    "start": "Start",
+    "pause": "Pause",
+    "reset": "Reset",
+    "settings": "Settings",
+    "theme": "Theme:",
+    "volume": "Volume:",
+    "language": "Language:",
+    "shortcuts": "Keyboard Shortcuts: Space (Start/Pause), R (Reset)",
+    "session_complete": "Session Complete!",
+    "take_break": "Time to take a break!",
+    "back_to_work": "Time to get back to work!",
+    "resume": "Resume",
+    "confirm_exit_title": "Quit?",
+    "confirm_exit_message": "A timer is running. Do you really want to quit?"
+}
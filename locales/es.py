@@ -0,0 +1,21 @@
+strings = {
+    "app_title": "Temporizador Pomodoro",
+    "work_session": "SESIÓN DE TRABAJO",
+    "break_session": "PAUSA",
+    "long_break_session": "PAUSA LARGA",
+    "sessions": "Sesiones",
+    "start": "Iniciar",
+    "pause": "Pausar",
+    "reset": "Reiniciar",
+    "settings": "Ajustes",
+    "theme": "Tema:",
+    "volume": "Volumen:",
+    "language": "Idioma:",
+    "shortcuts": "Atajos de teclado: Espacio (Iniciar/Pausar), R (Reiniciar)",
+    "session_complete": "¡Sesión completada!",
+    "take_break": "¡Hora de tomar un descanso!",
+    "back_to_work": "¡Hora de volver al trabajo!",
+    "resume": "Reanudar",
+    "confirm_exit_title": "¿Salir?",
+    "confirm_exit_message": "Hay un temporizador en marcha. ¿Seguro que quieres salir?"
+}
@@ -0,0 +1,21 @@
+strings = {
+    "app_title": "Minuteur Pomodoro",
+    "work_session": "SESSION DE TRAVAIL",
+    "break_session": "PAUSE",
+    "long_break_session": "LONGUE PAUSE",
+    "sessions": "Sessions",
+    "start": "Démarrer",
+    "pause": "Pause",
+    "reset": "Réinitialiser",
+    "settings": "Paramètres",
+    "theme": "Thème :",
+    "volume": "Volume :",
+    "language": "Langue :",
+    "shortcuts": "Raccourcis clavier : Espace (Démarrer/Pause), R (Réinitialiser)",
+    "session_complete": "Session terminée !",
+    "take_break": "C'est l'heure de la pause !",
+    "back_to_work": "C'est l'heure de reprendre le travail !",
+    "resume": "Reprendre",
+    "confirm_exit_title": "Quitter ?",
+    "confirm_exit_message": "Un minuteur est en cours. Voulez-vous vraiment quitter ?"
+}
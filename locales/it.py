@@ -0,0 +1,21 @@
+strings = {
+    "app_title": "Timer Pomodoro",
+    "work_session": "SESSIONE DI LAVORO",
+    "break_session": "PAUSA",
+    "long_break_session": "PAUSA LUNGA",
+    "sessions": "Sessioni",
+    "start": "Avvia",
+    "pause": "Pausa",
+    "reset": "Reimposta",
+    "settings": "Impostazioni",
+    "theme": "Tema:",
+    "volume": "Volume:",
+    "language": "Lingua:",
+    "shortcuts": "Scorciatoie: Spazio (Avvia/Pausa), R (Reimposta)",
+    "session_complete": "Sessione completata!",
+    "take_break": "È ora di fare una pausa!",
+    "back_to_work": "È ora di tornare al lavoro!",
+    "resume": "Riprendi",
+    "confirm_exit_title": "Uscire?",
+    "confirm_exit_message": "Un timer è in corso. Vuoi davvero uscire?"
+}
@@ -0,0 +1,21 @@
+strings = {
+    "app_title": "ポモドーロタイマー",
+    "work_session": "作業セッション",
+    "break_session": "休憩",
+    "long_break_session": "長休憩",
+    "sessions": "セッション",
+    "start": "開始",
+    "pause": "一時停止",
+    "reset": "リセット",
+    "settings": "設定",
+    "theme": "テーマ：",
+    "volume": "音量：",
+    "language": "言語：",
+    "shortcuts": "ショートカット：スペース（開始/一時停止）、R（リセット）",
+    "session_complete": "セッション完了！",
+    "take_break": "休憩時間です！",
+    "back_to_work": "作業に戻る時間です！",
+    "resume": "再開",
+    "confirm_exit_title": "終了しますか？",
+    "confirm_exit_message": "タイマーが動作中です。本当に終了しますか？"
+}
@@ -0,0 +1,21 @@
+strings = {
+    "app_title": "Temporizador Pomodoro",
+    "work_session": "SESSÃO DE TRABALHO",
+    "break_session": "PAUSA",
+    "long_break_session": "PAUSA LONGA",
+    "sessions": "Sessões",
+    "start": "Iniciar",
+    "pause": "Pausar",
+    "reset": "Reiniciar",
+    "settings": "Configurações",
+    "theme": "Tema:",
+    "volume": "Volume:",
+    "language": "Idioma:",
+    "shortcuts": "Atalhos: Espaço (Iniciar/Pausar), R (Reiniciar)",
+    "session_complete": "Sessão concluída!",
+    "take_break": "Hora de fazer uma pausa!",
+    "back_to_work": "Hora de voltar ao trabalho!",
+    "resume": "Retomar",
+    "confirm_exit_title": "Sair?",
+    "confirm_exit_message": "Um temporizador está em execução. Deseja realmente sair?"
+}
@@ -0,0 +1,21 @@
+strings = {
+    "app_title": "Таймер Помодоро",
+    "work_session": "РАБОЧАЯ СЕССИЯ",
+    "break_session": "ПЕРЕРЫВ",
+    "long_break_session": "ДЛИННЫЙ ПЕРЕРЫВ",
+    "sessions": "Сессии",
+    "start": "Старт",
+    "pause": "Пауза",
+    "reset": "Сброс",
+    "settings": "Настройки",
+    "theme": "Тема:",
+    "volume": "Громкость:",
+    "language": "Язык:",
+    "shortcuts": "Горячие клавиши: Пробел (Старт/Пауза), R (Сброс)",
+    "session_complete": "Сессия завершена!",
+    "take_break": "Время сделать перерыв!",
+    "back_to_work": "Время возвращаться к работе!",
+    "resume": "Продолжить",
+    "confirm_exit_title": "Выйти?",
+    "confirm_exit_message": "Таймер запущен. Вы действительно хотите выйти?"
+}
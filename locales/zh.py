@@ -0,0 +1,21 @@
+strings = {
+    "app_title": "番茄计时器",
+    "work_session": "工作阶段",
+    "break_session": "休息时间",
+    "long_break_session": "长休息",
+    "sessions": "阶段",
+    "start": "开始",
+    "pause": "暂停",
+    "reset": "重置",
+    "settings": "设置",
+    "theme": "主题：",
+    "volume": "音量：",
+    "language": "语言：",
+    "shortcuts": "快捷键：空格键（开始/暂停），R（重置）",
+    "session_complete": "阶段完成！",
+    "take_break": "该休息了！",
+    "back_to_work": "该回去工作了！",
+    "resume": "继续",
+    "confirm_exit_title": "退出？",
+    "confirm_exit_message": "计时器正在运行。确定要退出吗？"
+}
@@ -0,0 +1,208 @@
+"""Asynchronous desktop notifications.
+
+Sending a notification can be slow: on Linux plyer shells out to
+``notify-send``/``gdbus`` and may hang on a slow session bus. The
+``NotificationDispatcher`` queues notifications and sends them from a
+background worker with a per-call timeout, so a slow notifier can never
+delay the timer.
+
+On Linux, notifications are sent directly over a persistent D-Bus
+session-bus connection (``DBusNotifier``) when jeepney is installed and the
+bus is reachable, instead of spawning a process per notification.
+
+Backends are imported on first use, not when this module is loaded.
+"""
+
+import collections
+import queue
+import sys
+import threading
+import time
+
+APP_NAME = "Pomodoro Timer"
+
+# How long a notification bubble stays visible, in milliseconds
+EXPIRE_TIMEOUT_MS = 10000
+
+
+def plyer_notify(title, message):
+    """Send a notification through plyer (blocking)"""
+    # Imported on first use: plyer is slow to import and only needed when a
+    # session ends
+    from plyer import notification
+
+    notification.notify(
+        title=title,
+        message=message,
+        app_name=APP_NAME,
+        timeout=10
+    )
+
+
+class DBusNotifier:
+    """Send notifications through org.freedesktop.Notifications.
+
+    Keeps one session-bus connection open for the lifetime of the process
+    and reuses ``replaces_id`` so that each notification replaces the
+    previous bubble instead of stacking up.
+    """
+
+    def __init__(self, bus="SESSION", timeout=2.0):
+        from jeepney import DBusAddress
+        from jeepney.io.blocking import open_dbus_connection
+
+        self.timeout = timeout
+        self.connection = open_dbus_connection(bus=bus)
+        self.address = DBusAddress(
+            "/org/freedesktop/Notifications",
+            bus_name="org.freedesktop.Notifications",
+            interface="org.freedesktop.Notifications"
+        )
+        self.replaces_id = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, title, message):
+        from jeepney import DBusErrorResponse, MessageType, new_method_call
+
+        call = new_method_call(
+            self.address,
+            "Notify",
+            "susssasa{sv}i",
+            (APP_NAME, self.replaces_id, "", title, message, [], {}, EXPIRE_TIMEOUT_MS)
+        )
+        with self.lock:
+            reply = self.connection.send_and_get_reply(call, timeout=self.timeout)
+        if reply.header.message_type == MessageType.error:
+            raise DBusErrorResponse(reply)
+        self.replaces_id = reply.body[0]
+
+    def close(self):
+        """Close the bus connection"""
+        self.connection.close()
+
+
+def default_notifier():
+    """The fastest available notification backend.
+
+    Uses ``DBusNotifier`` on Linux when the session bus is available and
+    falls back to plyer otherwise.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            return DBusNotifier()
+        except Exception as e:
+            print(f"D-Bus notifications unavailable, using plyer: {e}")
+    return plyer_notify
+
+
+class NotificationDispatcher:
+    """Send notifications from a bounded background worker.
+
+    ``post`` never blocks. Identical notifications already waiting in the
+    queue are dropped, a send that takes longer than ``timeout`` seconds is
+    abandoned, and at most ``max_stuck`` abandoned sends may still be hanging
+    before new notifications are dropped.
+    """
+
+    def __init__(self, notify=None, timeout=5.0, max_pending=8, max_stuck=2):
+        self.notify = notify
+        self.timeout = timeout
+        self.max_stuck = max_stuck
+        self.queue = queue.Queue(max_pending)
+        self.pending = set()
+        self.stuck = []
+        self.lock = threading.Lock()
+        self.worker = None
+
+        # Metrics
+        self.sent = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.dropped = 0
+        self.deduplicated = 0
+        self.latencies = collections.deque(maxlen=100)  # post -> sent, seconds
+
+    def post(self, title, message):
+        """Queue a notification; returns False if it was dropped"""
+        key = (title, message)
+        with self.lock:
+            if key in self.pending:
+                self.deduplicated += 1
+                return False
+            try:
+                self.queue.put_nowait((key, time.monotonic()))
+            except queue.Full:
+                self.dropped += 1
+                return False
+            self.pending.add(key)
+            if self.worker is None:
+                self.worker = threading.Thread(target=self.run, name="NotificationDispatcher", daemon=True)
+                self.worker.start()
+        return True
+
+    def close(self, timeout=1.0):
+        """Stop the worker after the queued notifications are sent"""
+        with self.lock:
+            worker = self.worker
+        if worker:
+            self.queue.put(None)
+            worker.join(timeout)
+
+    def run(self):
+        """Worker loop"""
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            key, posted_at = item
+            with self.lock:
+                self.pending.discard(key)
+            if self.notify is None:
+                # Connect on the worker so a slow bus never delays the caller
+                self.notify = default_notifier()
+            self.send(key, posted_at)
+        if hasattr(self.notify, "close"):
+            self.notify.close()
+
+    def send(self, key, posted_at):
+        """Send one notification, giving up after ``timeout`` seconds"""
+        self.stuck = [thread for thread in self.stuck if thread.is_alive()]
+        if len(self.stuck) >= self.max_stuck:
+            self.dropped += 1
+            return
+
+        errors = []
+
+        def call():
+            try:
+                self.notify(*key)
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=call, name="notify", daemon=True)
+        thread.start()
+        thread.join(self.timeout)
+        if thread.is_alive():
+            self.timed_out += 1
+            self.stuck.append(thread)
+            print(f"Notification timed out after {self.timeout}s")
+        elif errors:
+            self.failed += 1
+            print(f"Notification error: {errors[0]}")
+        else:
+            self.sent += 1
+            self.latencies.append(time.monotonic() - posted_at)
+
+    def stats(self):
+        """Counters and latency summary of the dispatcher"""
+        latencies = list(self.latencies)
+        return {
+            "sent": self.sent,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "dropped": self.dropped,
+            "deduplicated": self.deduplicated,
+            "pending": self.queue.qsize(),
+            "avg_latency": sum(latencies) / len(latencies) if latencies else 0.0,
+            "max_latency": max(latencies, default=0.0)
+        }
@@ -1,19 +1,64 @@
+import sys
+from startup_profile import ImportProfiler, StartupProfiler
+
+# Time the imports below with --profile-startup (checked before argparse runs)
+import_profiler = ImportProfiler(enabled="--profile-startup" in sys.argv[1:]).install()
+
 import tkinter as tk
-from tkinter import messagebox
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from ttkbootstrap.dialogs import Messagebox
-import threading
-import time
-import json
+import argparse
 import os
-from plyer import notification
-import sys
-from translations import translations
+import time
+from translations import translations, DEFAULT_LANGUAGE
+from timer_engine import TimerEngine, WORK, SHORT_BREAK, LONG_BREAK
+from scheduler import TimerScheduler, START, PAUSE, RESET, TICKS_ON, TICKS_OFF
+from clock import SUSPEND_CONTINUE, SUSPEND_POLICIES
+from ui_dispatcher import UIDispatcher, PixelProgress
+from time_format import TimeStringTable, HHMMSS, FORMATS
+from animation import Animator, blink_keyframes
+from notifications import NotificationDispatcher
+from preferences import PreferencesStore
+from session_log import SessionLog
+from style_warmer import StyleWarmer
+
+# Heavy modules only imported when a feature needs them; --profile-startup
+# reports which of them were loaded. The history store (sqlite3) is not one
+# of them: the preferences are read from it before the window is built.
+OPTIONAL_MODULES = (
+    "asyncio", "ctypes", "numpy",
+    "async_runtime", "timerfd_backend", "theme_cache"
+)
+
+# Label text key and bootstyle for each timer type
+SESSION_STYLES = {
+    WORK: ("work_session", SUCCESS),
+    SHORT_BREAK: ("break_session", WARNING),
+    LONG_BREAK: ("long_break_session", INFO)
+}
+
+# Notification title/message keys shown when a timer of this type starts
+SESSION_NOTIFICATIONS = {
+    WORK: ("session_complete", "back_to_work"),
+    SHORT_BREAK: ("session_complete", "take_break"),
+    LONG_BREAK: ("session_complete", "take_break")
+}
+
+# Styles the session label and progress bar can switch to at transitions;
+# they are pre-built while idle so that no style is built when a session ends
+TRANSITION_STYLES = [
+    f"{bootstyle}.{widget_style}"
+    for _, bootstyle in SESSION_STYLES.values()
+    for widget_style in ("TLabel", "Horizontal.TProgressbar")
+]
 
 class PomodoroTimer:
-    def __init__(self, root):
+    def __init__(self, root, preferences=None, theme_cache=None, wakeup="thread", runtime=None, stats=False,
+                 history=None):
         self.root = root
+        self.history = history
+        self.theme_cache = theme_cache
+        self.stats = stats
         self.root.title("Pomodoro")
         self.root.geometry("800x600")
         self.root.resizable(True, True)
@@ -23,43 +68,72 @@ class PomodoroTimer:
         if os.path.exists(icon_path):
             self.root.iconbitmap(icon_path)
         
-        # Timer durations in seconds
-        self.durations = {
-            "work": 25 * 60,
-            "short_break": 5 * 60,
-            "long_break": 15 * 60
-        }
-        
-        # Timer state variables
-        self.timer_running = False
-        self.timer_paused = False
-        self.current_timer_type = "work"
-        self.time_remaining = self.durations["work"]
-        self.timer_thread = None
-        self.stop_thread = threading.Event()
-        
-        # Session tracking
-        self.completed_sessions = 0
-        self.total_sessions = 4
+        # All widget updates go through one coalescing dispatcher
+        self.ui = UIDispatcher(self.root)
+        self.animator = Animator(self.root)
+        if runtime:
+            from async_runtime import AsyncNotifier
+            self.notifier = AsyncNotifier()
+        else:
+            self.notifier = NotificationDispatcher()
         
-        # User preferences
-        self.theme = "darkly"  # Default dark theme
-        self.volume = 50  # Default volume (0-100)
-        self.language = "en"  # Default language
+        # Timer state (durations, session cycle, running/paused) lives in
+        # the headless engine; the GUI only subscribes to its events
+        self.engine = TimerEngine()
         
-        # Load saved preferences
+        # User preferences, kept in memory and written behind. main() loads
+        # them before creating the window so only the saved theme is built.
+        if preferences is None:
+            preferences = PreferencesStore().load()
+        self.preferences = preferences
         self.load_preferences()
         
-        # Apply theme
-        self.style = ttk.Style(theme=self.theme)
+        # One persistent scheduler thread drives the engine, or with the
+        # timerfd backend the Tk event loop itself, or a coroutine on the
+        # asyncio runtime
+        self.timer_scheduler = TimerScheduler(self.engine, suspend_policy=self.suspend_policy)
+        self.scheduler = self.timer_scheduler
+        if runtime:
+            from async_runtime import AsyncSchedulerDriver
+            self.scheduler = AsyncSchedulerDriver(runtime, self.scheduler)
+        elif wakeup == "timerfd":
+            from timerfd_backend import TimerfdDriver
+            self.scheduler = TimerfdDriver(self.root, self.scheduler)
+        
+        # Every transition is appended to the session log (and the history
+        # database) by a writer thread. It subscribes before the GUI so it
+        # sees each event first.
+        self.session_log = SessionLog(clock=self.timer_scheduler.clock, history=self.history).attach(self.engine)
+        self.engine.subscribe(self.on_engine_event)
+        self.scheduler.start()
+        
+        # Display strings of every second, looked up on each tick
+        self.time_strings = None
+        self.rebuild_time_strings()
+        
+        # Apply theme (a no-op when the window was created with it)
+        self.style = self.root.style
+        if self.style.theme.name != self.theme:
+            self.style.theme_use(self.theme)
         
         # Create UI elements
         self.create_widgets()
         
+        # Pre-builds the transition styles once the first frame is shown
+        self.style_warmer = StyleWarmer(self.root, TRANSITION_STYLES)
+        
         # Bind keyboard shortcuts
         self.root.bind("<space>", lambda event: self.toggle_timer())
         self.root.bind("r", lambda event: self.reset_timer())
         
+        # Stop rendering while the window is minimized or obscured
+        self.window_visible = True
+        self.visibility_changed_at = time.monotonic()
+        self.visibility_counters = self.read_counters()
+        self.root.bind("<Map>", self.on_visibility_event, add="+")
+        self.root.bind("<Unmap>", self.on_visibility_event, add="+")
+        self.root.bind("<Visibility>", self.on_visibility_event, add="+")
+        
         # Handle window close event
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
     
@@ -78,7 +152,7 @@ class PomodoroTimer:
         # Session tracking display
         self.session_label = ttk.Label(
             header_frame, 
-            text=f"{translations[self.language]['sessions']}: {self.completed_sessions}/{self.total_sessions}", 
+            text=f"{translations[self.language]['sessions']}: {self.engine.completed_sessions}/{self.engine.total_sessions}", 
             font=("TkDefaultFont", 12)
         )
         self.session_label.pack(side=RIGHT, padx=10)
@@ -101,7 +175,7 @@ class PomodoroTimer:
         
         self.timer_display = ttk.Label(
             timer_frame,
-            text=self.format_time(self.time_remaining),
+            text=self.format_time(self.engine.time_remaining),
             font=("TkDefaultFont", 48, "bold"),
             anchor=CENTER
         )
@@ -119,6 +193,8 @@ class PomodoroTimer:
             value=0
         )
         self.progress_bar.pack(fill=X)
+        self.progress = PixelProgress()
+        self.progress_bar.bind("<Configure>", self.on_progress_configure)
         
         # Control buttons
         buttons_frame = ttk.Frame(main_frame)
@@ -155,9 +231,39 @@ class PomodoroTimer:
         )
         self.reset_button.pack(side=LEFT, padx=10)
         
-        # Settings frame
-        settings_frame = ttk.LabelFrame(main_frame, text=self.get_text("settings"), padding=10)
-        settings_frame.pack(fill=X, pady=20)
+        # Settings panel: collapsed by default and built on demand (or while
+        # idle after the first frame), so it does not delay startup
+        self.settings_frame = None
+        self.settings_visible = False
+        self.settings_button = ttk.Button(
+            main_frame,
+            text=self.settings_button_text(),
+            bootstyle=LINK,
+            command=self.toggle_settings
+        )
+        self.settings_button.pack(anchor=W, pady=(20, 0))
+        
+        self.settings_container = ttk.Frame(main_frame)
+        self.settings_container.pack(fill=X)
+        
+        # Keyboard shortcuts info
+        shortcuts_frame = ttk.Frame(main_frame)
+        shortcuts_frame.pack(fill=X, pady=(20, 0))
+        
+        shortcuts_label = ttk.Label(
+            shortcuts_frame,
+            text=self.get_text("shortcuts"),
+            font=("TkDefaultFont", 9),
+            foreground="gray"
+        )
+        shortcuts_label.pack()
+    
+    def build_settings_panel(self):
+        """Create the settings widgets (hidden until the panel is expanded)"""
+        if self.settings_frame is not None:
+            return
+        settings_frame = ttk.LabelFrame(self.settings_container, text=self.get_text("settings"), padding=10)
+        self.settings_frame = settings_frame
         
         # Language selection
         lang_frame = ttk.Frame(settings_frame)
@@ -235,202 +341,178 @@ class PomodoroTimer:
         
         self.volume_label = ttk.Label(volume_frame, text=f"{self.volume}%", width=5)
         self.volume_label.pack(side=LEFT, padx=10)
-        
-        # Keyboard shortcuts info
-        shortcuts_frame = ttk.Frame(main_frame)
-        shortcuts_frame.pack(fill=X, pady=(20, 0))
-        
-        shortcuts_label = ttk.Label(
-            shortcuts_frame,
-            text=self.get_text("shortcuts"),
-            font=("TkDefaultFont", 9),
-            foreground="gray"
-        )
-        shortcuts_label.pack()
+    
+    def settings_button_text(self):
+        """Label of the settings toggle, with an expanded/collapsed arrow"""
+        arrow = "▾" if self.settings_visible else "▸"
+        return f"{self.get_text('settings')} {arrow}"
+    
+    def toggle_settings(self):
+        """Expand or collapse the settings panel"""
+        self.build_settings_panel()
+        self.settings_visible = not self.settings_visible
+        if self.settings_visible:
+            self.settings_frame.pack(fill=X, pady=(10, 0))
+        else:
+            self.settings_frame.pack_forget()
+        self.ui.configure(self.settings_button, text=self.settings_button_text())
+    
+    def on_visibility_event(self, event):
+        """Track whether the main window can be seen"""
+        if event.widget is not self.root:
+            return
+        if event.type == tk.EventType.Unmap:
+            self.set_window_visible(False)
+        elif event.type == tk.EventType.Map:
+            self.set_window_visible(True)
+        else:
+            self.set_window_visible(event.state != "VisibilityFullyObscured")
+    
+    def set_window_visible(self, visible):
+        """While hidden, skip all rendering and only wake for the end of the
+        timer; render once when shown again"""
+        if visible == self.window_visible:
+            return
+        self.report_visibility_stats()
+        self.window_visible = visible
+        self.ui.set_visible(visible)
+        self.scheduler.send(TICKS_ON if visible else TICKS_OFF)
+    
+    def read_counters(self):
+        """Timer wakeups and UI renders so far"""
+        return self.timer_scheduler.wakeups, self.ui.flushes
+    
+    def report_visibility_stats(self):
+        """Print wakeups/s for the period that is ending (with --stats)"""
+        now = time.monotonic()
+        counters = self.read_counters()
+        if self.stats:
+            duration = max(now - self.visibility_changed_at, 1e-9)
+            wakeups = counters[0] - self.visibility_counters[0]
+            renders = counters[1] - self.visibility_counters[1]
+            state = "visible" if self.window_visible else "hidden"
+            print(f"Window {state} for {duration:.1f} s: {wakeups} timer wakeups "
+                  f"({wakeups / duration:.2f}/s), {renders} UI renders ({renders / duration:.2f}/s)")
+        self.visibility_changed_at = now
+        self.visibility_counters = counters
+    
+    def report_lateness(self):
+        """Print how late the timer woke up after its deadlines (with --stats)"""
+        if self.stats:
+            print("Timer wakeup lateness:")
+            print(self.timer_scheduler.lateness.format())
+    
+    def rebuild_time_strings(self):
+        """Rebuild the display string table if the durations or the display
+        format changed"""
+        max_seconds = max(self.engine.durations.values())
+        display_format = self.time_format
+        table = self.time_strings
+        if table is None or table.max_seconds != max_seconds or table.display_format != display_format:
+            self.time_strings = TimeStringTable(max_seconds, display_format)
     
     def format_time(self, seconds):
-        """Format seconds into HH:MM:SS"""
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        """Format seconds for the timer display (HH:MM:SS or MM:SS)"""
+        return self.time_strings.format(seconds)
     
     def start_timer(self):
-        """Start the timer"""
-        if self.timer_paused:
-            # Resume timer
-            self.timer_paused = False
-            self.timer_running = True
-        else:
-            # Start new timer
-            self.timer_running = True
-            self.stop_thread.clear()
-            
-            # Create and start timer thread
-            self.timer_thread = threading.Thread(target=self.run_timer)
-            self.timer_thread.daemon = True
-            self.timer_thread.start()
+        """Start or resume the timer"""
+        self.scheduler.send(START)
         
         # Update button states
-        self.start_button.config(state=DISABLED)
-        self.pause_button.config(state=NORMAL)
+        self.ui.configure(self.start_button, state=DISABLED)
+        self.ui.configure(self.pause_button, state=NORMAL)
     
     def pause_timer(self):
         """Pause the timer"""
-        self.timer_paused = True
-        self.timer_running = False
+        self.scheduler.send(PAUSE)
         
         # Update button states
-        self.start_button.config(state=NORMAL, text=self.get_text("resume"))
-        self.pause_button.config(state=DISABLED)
+        self.ui.configure(self.start_button, state=NORMAL, text=self.get_text("resume"))
+        self.ui.configure(self.pause_button, state=DISABLED)
     
     def reset_timer(self):
-        """Reset the timer"""
-        # Stop current timer
-        if self.timer_running or self.timer_paused:
-            self.stop_thread.set()
-            if self.timer_thread and self.timer_thread.is_alive():
-                self.timer_thread.join(0.1)
-        
-        # Reset timer state
-        self.timer_running = False
-        self.timer_paused = False
-        self.current_timer_type = "work"
-        self.time_remaining = self.durations["work"]
-        
-        # Update UI
-        self.timer_display.config(text=self.format_time(self.time_remaining))
-        self.progress_bar.config(value=0, bootstyle=SUCCESS)
-        self.session_type_label.config(text=self.get_text("work_session"), bootstyle=SUCCESS)
+        """Reset the timer; the display is updated by on_engine_event"""
+        self.scheduler.send(RESET)
         
         # Reset button states
-        self.start_button.config(state=NORMAL, text=self.get_text("start"))
-        self.pause_button.config(state=DISABLED)
+        self.ui.configure(self.start_button, state=NORMAL, text=self.get_text("start"))
+        self.ui.configure(self.pause_button, state=DISABLED)
     
     def toggle_timer(self):
         """Toggle between start and pause (for keyboard shortcut)"""
-        if self.timer_running:
+        if self.engine.running:
             self.pause_timer()
         else:
             self.start_timer()
     
-    def run_timer(self):
-        """Run the timer in a separate thread"""
-        start_time = time.time()
-        original_duration = self.durations[self.current_timer_type]
-        elapsed_paused_time = 0
-        last_update_time = start_time
-        
-        while self.time_remaining > 0 and not self.stop_thread.is_set():
-            if self.timer_paused:
-                # Track paused time
-                if not elapsed_paused_time:
-                    elapsed_paused_time = time.time()
-                time.sleep(0.1)
-                continue
-            
-            # If we were paused, adjust the start time
-            if elapsed_paused_time:
-                paused_duration = time.time() - elapsed_paused_time
-                start_time += paused_duration
-                elapsed_paused_time = 0
-            
-            # Calculate time remaining
-            elapsed = time.time() - start_time
-            self.time_remaining = max(0, original_duration - int(elapsed))
-            
-            # Update UI every 0.1 seconds
-            if time.time() - last_update_time >= 0.1:
-                self.update_ui()
-                last_update_time = time.time()
-            
-            time.sleep(0.05)  # Small sleep to prevent high CPU usage
-        
-        # Timer completed
-        if not self.stop_thread.is_set() and self.time_remaining <= 0:
-            self.time_remaining = 0
+    def on_engine_event(self, event, data):
+        """Reflect engine transitions in the UI (called on the scheduler thread)"""
+        if event == "tick":
+            self.update_ui()
+        elif event == "paused":
+            # Also sent when the suspend policy pauses the timer
+            self.ui.configure(self.start_button, state=NORMAL, text=self.get_text("resume"))
+            self.ui.configure(self.pause_button, state=DISABLED)
+        elif event == "reset":
+            self.ui.call(self.animator.cancel_all)
+            self.show_session_type(WORK)
             self.update_ui()
-            self.timer_completed()
+        elif event == "completed":
+            self.timer_completed(data["timer_type"], data["next_timer_type"])
+    
+    def on_progress_configure(self, event):
+        """Track the progress bar width so it is only redrawn when it moves
+        by a pixel"""
+        self.progress.resize(event.width)
+        self.update_ui()
     
     def update_ui(self):
         """Update the UI elements with current timer state"""
         # Update timer display
-        self.root.after(0, lambda: self.timer_display.config(text=self.format_time(self.time_remaining)))
+        self.ui.configure(self.timer_display, text=self.format_time(self.engine.time_remaining))
         
-        # Update progress bar
-        progress = 100 - (self.time_remaining / self.durations[self.current_timer_type] * 100)
-        self.root.after(0, lambda: self.progress_bar.config(value=progress))
+        # Update progress bar, only when it moves by at least one pixel
+        duration = self.engine.duration
+        value = self.progress.update(duration - self.engine.time_remaining, duration)
+        if value is not None:
+            self.ui.configure(self.progress_bar, value=value)
+    
+    def show_session_type(self, timer_type):
+        """Show the label and colors of a timer type"""
+        text_key, bootstyle = SESSION_STYLES[timer_type]
+        self.ui.configure(self.session_type_label, text=self.get_text(text_key), bootstyle=bootstyle)
+        self.ui.configure(self.progress_bar, bootstyle=bootstyle)
     
-    def timer_completed(self):
+    def update_session_label(self):
+        """Show the number of completed sessions"""
+        self.ui.configure(
+            self.session_label,
+            text=f"{self.get_text('sessions')}: {self.engine.completed_sessions}/{self.engine.total_sessions}"
+        )
+    
+    def timer_completed(self, finished_type, next_type):
         """Handle timer completion"""
         # Play sound alert
         self.play_sound()
         
-        # Show visual indication
-        self.flash_timer_display()
-        
-        # Reset timer state
-        self.timer_running = False
-        self.timer_paused = False
+        # Show visual indication (animated on the main thread)
+        self.ui.call(self.flash_timer_display)
         
         # Update button states
-        self.root.after(0, lambda: self.start_button.config(state=NORMAL, text=self.get_text("start")))
-        self.root.after(0, lambda: self.pause_button.config(state=DISABLED))
-        
-        # Handle session completion
-        if self.current_timer_type == "work":
-            # Increment completed sessions
-            self.completed_sessions += 1
-            self.root.after(0, lambda: self.session_label.config(
-                text=f"{self.get_text('sessions')}: {self.completed_sessions}/{self.total_sessions}"
-            ))
-            
-            # Determine next break type
-            if self.completed_sessions % self.total_sessions == 0:
-                # Long break after 4 sessions
-                self.current_timer_type = "long_break"
-                self.time_remaining = self.durations["long_break"]
-                self.root.after(0, lambda: self.session_type_label.config(
-                    text=self.get_text("long_break"), bootstyle=INFO
-                ))
-                self.root.after(0, lambda: self.progress_bar.config(bootstyle=INFO))
-                
-                # Show notification
-                self.show_notification(
-                    self.get_text("long_break_notification_title"),
-                    self.get_text("long_break_notification_message")
-                )
-            else:
-                # Short break after sessions 1-3
-                self.current_timer_type = "short_break"
-                self.time_remaining = self.durations["short_break"]
-                self.root.after(0, lambda: self.session_type_label.config(
-                    text=self.get_text("short_break"), bootstyle=WARNING
-                ))
-                self.root.after(0, lambda: self.progress_bar.config(bootstyle=WARNING))
-                
-                # Show notification
-                self.show_notification(
-                    self.get_text("short_break_notification_title"),
-                    self.get_text("short_break_notification_message")
-                )
-        else:
-            # After break, go back to work
-            self.current_timer_type = "work"
-            self.time_remaining = self.durations["work"]
-            self.root.after(0, lambda: self.session_type_label.config(
-                text=self.get_text("work_session"), bootstyle=SUCCESS
-            ))
-            self.root.after(0, lambda: self.progress_bar.config(bootstyle=SUCCESS))
-            
-            # Show notification
-            self.show_notification(
-                self.get_text("break_finished_notification_title"),
-                self.get_text("break_finished_notification_message")
-            )
+        self.ui.configure(self.start_button, state=NORMAL, text=self.get_text("start"))
+        self.ui.configure(self.pause_button, state=DISABLED)
+        
+        if finished_type == WORK:
+            self.update_session_label()
         
-        # Update timer display with new time
-        self.root.after(0, lambda: self.timer_display.config(text=self.format_time(self.time_remaining)))
+        # Show the next session type and its full time
+        self.show_session_type(next_type)
+        self.update_ui()
+        
+        # Show notification
+        title_key, message_key = SESSION_NOTIFICATIONS[next_type]
+        self.show_notification(self.get_text(title_key), self.get_text(message_key))
     
     def play_sound(self):
         """Play a sound alert when timer ends"""
@@ -441,43 +523,33 @@ class PomodoroTimer:
             pass
     
     def flash_timer_display(self):
-        """Flash the timer display as a visual indication"""
-        original_bg = self.timer_display.cget("background")
-        original_fg = self.timer_display.cget("foreground")
-        
-        # Flash 3 times
-        for _ in range(3):
-            # Change to alert color
-            self.root.after(0, lambda: self.timer_display.config(
-                background=self.style.colors.danger,
-                foreground="white"
-            ))
-            self.root.update()
-            time.sleep(0.3)
-            
-            # Change back to original color
-            self.root.after(0, lambda: self.timer_display.config(
-                background=original_bg,
-                foreground=original_fg
-            ))
-            self.root.update()
-            time.sleep(0.3)
+        """Flash the timer display as a visual indication (main thread only)"""
+        # Stop a running flash first so its colors are not taken as original
+        self.animator.cancel("flash")
+        original = {
+            "background": self.timer_display.cget("background"),
+            "foreground": self.timer_display.cget("foreground")
+        }
+        alert = {"background": self.style.colors.danger, "foreground": "white"}
+        
+        # Flash 3 times, restoring the original colors when done or cancelled
+        self.animator.play(
+            "flash",
+            blink_keyframes(self.timer_display, alert, original, times=3, interval_ms=300),
+            on_stop=lambda: self.timer_display.config(**original)
+        )
     
     def show_notification(self, title, message):
-        """Show a system notification"""
-        try:
-            notification.notify(
-                title=title,
-                message=message,
-                app_name="Pomodoro Timer",
-                timeout=10
-            )
-        except Exception as e:
-            print(f"Notification error: {e}")
+        """Show a system notification (sent in the background)"""
+        self.notifier.post(title, message)
     
     def get_text(self, key):
-        """Get translated text for the given key"""
-        return translations[self.language][key]
+        """Get translated text for the given key, falling back to English
+        and then to the key itself"""
+        text = translations[self.language].get(key)
+        if text is None:
+            text = translations[DEFAULT_LANGUAGE].get(key, key)
+        return text
     
     def change_language(self, event=None, language_names=None):
         """Change the application language"""
@@ -493,54 +565,59 @@ class PomodoroTimer:
     def update_ui_text(self):
         """Update all UI text elements with the current language"""
         self.root.title(translations[self.language]["app_title"])
-        self.session_type_label.configure(text=translations[self.language]["work_session"])
-        self.start_button.configure(text=translations[self.language]["start"])
-        self.pause_button.configure(text=translations[self.language]["pause"])
-        self.reset_button.configure(text=translations[self.language]["reset"])
-        self.session_label.configure(text=f"{translations[self.language]['sessions']}: {self.completed_sessions}/{self.total_sessions}")
+        self.show_session_type(self.engine.current_timer_type)
+        self.ui.configure(self.start_button, text=translations[self.language]["start"])
+        self.ui.configure(self.pause_button, text=translations[self.language]["pause"])
+        self.ui.configure(self.reset_button, text=translations[self.language]["reset"])
+        self.ui.configure(self.settings_button, text=self.settings_button_text())
+        self.update_session_label()
     
     def change_theme(self, event=None):
         """Change the application theme"""
         selected_theme = self.theme_var.get()
         self.theme = selected_theme
         self.style = ttk.Style(theme=selected_theme)
+        # The theme change restyles widgets behind the dispatcher's back
+        self.ui.forget()
         self.save_preferences()
+        if self.theme_cache:
+            self.root.after_idle(self.theme_cache.save)
     
     def update_volume(self, event=None):
-        """Update the volume level"""
-        self.volume = self.volume_var.get()
+        """Update the volume level (called for every slider motion)"""
+        volume = self.volume_var.get()
+        if volume == self.volume:
+            return
+        self.volume = volume
         self.volume_label.config(text=f"{self.volume}%")
         self.save_preferences()
     
     def load_preferences(self):
-        """Load user preferences from file"""
-        try:
-            if os.path.exists("preferences.json"):
-                with open("preferences.json", "r") as f:
-                    prefs = json.load(f)
-                    self.theme = prefs.get("theme", self.theme)
-                    self.volume = prefs.get("volume", self.volume)
-                    self.language = prefs.get("language", self.language)
-        except Exception as e:
-            print(f"Error loading preferences: {e}")
+        """Apply the loaded user preferences"""
+        self.theme = self.preferences["theme"]
+        self.volume = self.preferences["volume"]
+        self.language = self.preferences["language"]
+        if self.language not in translations:
+            self.language = DEFAULT_LANGUAGE
+        self.suspend_policy = self.preferences["suspend_policy"]
+        if self.suspend_policy not in SUSPEND_POLICIES:
+            print(f"Unknown suspend policy {self.suspend_policy!r}, using {SUSPEND_CONTINUE!r}")
+            self.suspend_policy = SUSPEND_CONTINUE
+        self.time_format = self.preferences["time_format"]
+        if self.time_format not in FORMATS:
+            print(f"Unknown time format {self.time_format!r}, using {HHMMSS!r}")
+            self.time_format = HHMMSS
     
     def save_preferences(self):
-        """Save user preferences to file"""
-        try:
-            prefs = {
-                "theme": self.theme,
-                "volume": self.volume,
-                "language": self.language
-            }
-            with open("preferences.json", "w") as f:
-                json.dump(prefs, f)
-        except Exception as e:
-            print(f"Error saving preferences: {e}")
+        """Record user preferences; the file is written after a short debounce"""
+        self.preferences.update(theme=self.theme, volume=self.volume, language=self.language)
     
     def on_closing(self):
         """Handle application closing"""
-        if self.timer_running or self.timer_paused:
-            # Ask for confirmation if timer is running
+        if self.engine.running or self.engine.paused:
+            # Ask for confirmation if timer is running (dialogs are only
+            # imported when needed)
+            from ttkbootstrap.dialogs import Messagebox
             confirm = Messagebox.yesno(
                 self.get_text("confirm_exit_title"),
                 self.get_text("confirm_exit_message"),
@@ -549,27 +626,125 @@ class PomodoroTimer:
             if not confirm:
                 return
         
-        # Stop timer thread
-        self.stop_thread.set()
-        if self.timer_thread and self.timer_thread.is_alive():
-            self.timer_thread.join(0.1)
+        self.report_visibility_stats()
+        self.report_lateness()
+        
+        # Stop the scheduler thread, flush pending notifications and history
+        self.scheduler.stop()
+        self.notifier.close(0.5)
+        self.session_log.close()
         
-        # Save preferences
+        # Save preferences and write them out now
         self.save_preferences()
+        self.preferences.close()
+        if self.history:
+            self.history.close()
+        if self.theme_cache:
+            self.theme_cache.save()
         
         # Close application
         self.root.destroy()
         sys.exit(0)
 
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Pomodoro Timer")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print a timing report of the startup phases"
+    )
+    parser.add_argument(
+        "--wakeup",
+        choices=["thread", "timerfd", "asyncio"],
+        default="thread",
+        help="how the timer waits for deadlines: a scheduler thread, a Linux "
+             "timerfd in the Tk loop, or an asyncio loop that also drives Tk"
+    )
+    parser.add_argument(
+        "--theme-cache",
+        action="store_true",
+        help="experimental: reuse theme images cached on disk instead of drawing them at startup"
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="print timer wakeups and UI renders per second while visible and hidden, "
+             "and the timer wakeup lateness on exit"
+    )
+    args = parser.parse_args(argv)
+    if args.wakeup == "timerfd":
+        # The alternative backends are only imported when selected
+        from timerfd_backend import is_available
+        if not is_available():
+            print("timerfd is not available on this system, using the scheduler thread")
+            args.wakeup = "thread"
+    return args
+
 def main():
+    args = parse_args()
+    profiler = StartupProfiler(enabled=args.profile_startup, imports=import_profiler)
+    
+    # Session history and preferences live in one SQLite database
+    try:
+        from history_store import HistoryStore
+        history = HistoryStore()
+    except Exception as e:
+        print(f"Error opening session history: {e}")
+        history = None
+    profiler.mark("open history")
+    
+    # Load preferences first so the window is built with the saved theme
+    preferences = PreferencesStore(storage=history).load()
+    profiler.mark("load preferences")
+    
+    # Experimental: load theme images from an on-disk cache
+    theme_cache = None
+    if args.theme_cache:
+        from theme_cache import ThemeAssetCache
+        theme_cache = ThemeAssetCache().install()
+    
     # Create root window
-    root = ttk.Window(themename="darkly")
+    root = ttk.Window(themename=preferences["theme"])
+    profiler.mark("create window and theme")
     
     # Create Pomodoro Timer
-    app = PomodoroTimer(root)
+    runtime = None
+    if args.wakeup == "asyncio":
+        from async_runtime import AsyncRuntime
+        runtime = AsyncRuntime(root)
+    app = PomodoroTimer(root, preferences, theme_cache, args.wakeup, runtime, args.stats, history)
+    profiler.mark("create widgets")
+    
+    def first_frame():
+        profiler.mark("first frame")
+        root.after_idle(prebuild_settings)
+    
+    def prebuild_settings():
+        # Build the collapsed settings panel while idle, then report
+        app.build_settings_panel()
+        profiler.mark("settings panel (idle)")
+        profiler.note(f"themes built: {', '.join(sorted(root.style._theme_objects))}")
+        if theme_cache:
+            profiler.note(f"theme cache: {theme_cache.hits} hits, {theme_cache.misses} misses")
+        loaded = [name for name in OPTIONAL_MODULES if name in sys.modules]
+        skipped = [name for name in OPTIONAL_MODULES if name not in sys.modules]
+        profiler.note(f"optional modules loaded: {', '.join(loaded) or 'none'}")
+        profiler.note(f"optional modules not loaded: {', '.join(skipped) or 'none'}")
+        profiler.note("history store (sqlite3): required, holds the preferences read before the window")
+        profiler.report()
+        import_profiler.uninstall()
+        if theme_cache:
+            theme_cache.save()
+        app.style_warmer.start()
+    
+    root.after_idle(first_frame)
     
     # Start main loop
-    root.mainloop()
+    if runtime:
+        runtime.run()
+    else:
+        root.mainloop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,7 +6,11 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    hiddenimports=[
+        # Languages are imported by name on first use (see translations.py)
+        'locales.en', 'locales.fr', 'locales.de', 'locales.ar', 'locales.es',
+        'locales.it', 'locales.pt', 'locales.ru', 'locales.zh', 'locales.ja',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,134 @@
+"""Write-behind preferences store.
+
+Preferences are kept in memory. Changes are coalesced and written to disk
+by a debounce timer (and on ``close``) rather than on every change, and the
+file is replaced atomically so that a crash mid-write can never leave a
+truncated JSON file behind.
+
+With a ``storage`` (such as ``HistoryStore``), preferences are read from and
+written to it instead; the JSON file is only read while the storage has no
+preferences yet, so existing settings carry over.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+PREFERENCES_FILE = "preferences.json"
+
+DEFAULT_PREFERENCES = {
+    "theme": "darkly",  # Default dark theme
+    "volume": 50,  # Default volume (0-100)
+    "language": "en",  # Default language
+    "suspend_policy": "continue",  # See clock.SUSPEND_POLICIES
+    "time_format": "hh:mm:ss"  # Or "mm:ss", see time_format.FORMATS
+}
+
+# Quiet period after the last change before preferences are written
+DEBOUNCE_SECONDS = 1.0
+
+
+class PreferencesStore:
+    """In-memory preferences with debounced, atomic persistence"""
+
+    def __init__(self, path=PREFERENCES_FILE, defaults=None, debounce=DEBOUNCE_SECONDS, storage=None):
+        self.path = path
+        self.storage = storage
+        self.values = dict(DEFAULT_PREFERENCES if defaults is None else defaults)
+        self.debounce = debounce
+        self.lock = threading.Lock()
+        self.dirty = False
+        self.last_change = 0.0
+        self.timer = None
+
+        # Instrumentation
+        self.writes = 0
+        self.writes_avoided = 0
+
+    def load(self):
+        """Load preferences from file, keeping defaults for missing keys"""
+        try:
+            prefs = self.storage.read_preferences() if self.storage else None
+            if prefs is None and os.path.exists(self.path):
+                with open(self.path, "r") as f:
+                    prefs = json.load(f)
+            if prefs:
+                with self.lock:
+                    self.values.update(prefs)
+        except Exception as e:
+            print(f"Error loading preferences: {e}")
+        return self
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def update(self, **changes):
+        """Change preferences; they are written after the debounce period"""
+        with self.lock:
+            changes = {key: value for key, value in changes.items() if self.values.get(key) != value}
+            if not changes:
+                return
+            self.values.update(changes)
+            if self.dirty:
+                # Coalesced into the write that is already pending
+                self.writes_avoided += 1
+            self.dirty = True
+            self.last_change = time.monotonic()
+            if self.timer is None:
+                self._start_timer(self.debounce)
+
+    def _start_timer(self, delay):
+        # Must be called with the lock held
+        self.timer = threading.Timer(delay, self._on_timer)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def _on_timer(self):
+        with self.lock:
+            self.timer = None
+            remaining = self.last_change + self.debounce - time.monotonic()
+            if remaining > 0:
+                # Changed again since the timer was started; wait for quiet
+                self._start_timer(remaining)
+                return
+        self.flush()
+
+    def flush(self):
+        """Write pending changes to disk now"""
+        with self.lock:
+            if not self.dirty:
+                return
+            prefs = dict(self.values)
+            self.dirty = False
+        try:
+            if self.storage:
+                self.storage.write_preferences(prefs)
+                self.writes += 1
+                return
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp_path = tempfile.mkstemp(prefix=".preferences-", suffix=".tmp", dir=directory)
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(prefs, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self.writes += 1
+        except Exception as e:
+            print(f"Error saving preferences: {e}")
+
+    def close(self):
+        """Cancel the debounce timer and write pending changes"""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+        self.flush()
@@ -0,0 +1,213 @@
+"""Incrementally maintained history rollups.
+
+Totals per day, per week and per task (each split by timer type) and the
+streak of days with a completed work session are stored next to the
+sessions in the history database. ``apply`` updates them in O(1) per
+finished session, in the same transaction that inserts it, so dashboards
+read the totals instead of scanning the sessions.
+
+``rebuild`` recomputes every rollup from the sessions table and ``check``
+compares the stored rollups with a from-scratch recompute::
+
+    python rollups.py check [history.sqlite3]
+    python rollups.py rebuild [history.sqlite3]
+"""
+
+import argparse
+import sqlite3
+import sys
+
+from timer_engine import WORK
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rollup_day (
+    day INTEGER NOT NULL,       -- Date ordinal
+    type TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    completed INTEGER NOT NULL,
+    focus INTEGER NOT NULL,     -- Seconds
+    pauses INTEGER NOT NULL,
+    PRIMARY KEY (day, type)
+);
+CREATE TABLE IF NOT EXISTS rollup_week (
+    week INTEGER NOT NULL,      -- Date ordinal of the Monday
+    type TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    completed INTEGER NOT NULL,
+    focus INTEGER NOT NULL,
+    pauses INTEGER NOT NULL,
+    PRIMARY KEY (week, type)
+);
+CREATE TABLE IF NOT EXISTS rollup_task (
+    task TEXT NOT NULL,         -- '' for sessions without a task
+    type TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    completed INTEGER NOT NULL,
+    focus INTEGER NOT NULL,
+    pauses INTEGER NOT NULL,
+    PRIMARY KEY (task, type)
+);
+CREATE TABLE IF NOT EXISTS rollup_streak (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    last_day INTEGER NOT NULL,  -- Last day with a completed work session
+    current INTEGER NOT NULL,   -- Length of the streak ending on last_day
+    longest INTEGER NOT NULL
+);
+"""
+
+# Rollup table -> (key column, key expression over the sessions table)
+TABLES = {
+    "rollup_day": ("day", "day"),
+    "rollup_week": ("week", "day - (day - 1) % 7"),
+    "rollup_task": ("task", "COALESCE(task, '')")
+}
+
+UPSERT_SQL = (
+    "INSERT INTO {table} ({key}, type, sessions, completed, focus, pauses) VALUES (?, ?, 1, ?, ?, ?) "
+    "ON CONFLICT ({key}, type) DO UPDATE SET "
+    "sessions = sessions + 1, completed = completed + excluded.completed, "
+    "focus = focus + excluded.focus, pauses = pauses + excluded.pauses"
+)
+UPSERTS = {table: UPSERT_SQL.format(table=table, key=key) for table, (key, _) in TABLES.items()}
+
+RECOMPUTE_SQL = (
+    "SELECT {expression}, type, COUNT(*), SUM(completed), SUM(actual), SUM(pauses) "
+    "FROM sessions GROUP BY 1, type"
+)
+SELECT_SQL = "SELECT {key}, type, sessions, completed, focus, pauses FROM {table}"
+
+SELECT_STREAK = "SELECT last_day, current, longest FROM rollup_streak WHERE id = 1"
+UPSERT_STREAK = (
+    "INSERT INTO rollup_streak (id, last_day, current, longest) VALUES (1, ?, ?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET last_day = excluded.last_day, "
+    "current = excluded.current, longest = excluded.longest"
+)
+STREAK_DAYS = f"SELECT DISTINCT day FROM sessions WHERE type = '{WORK}' AND completed = 1 ORDER BY day"
+
+
+def create(connection):
+    connection.executescript(SCHEMA)
+
+
+def extend_streak(streak, day):
+    """Streak state ``(last_day, current, longest)`` after a completed work
+    session on ``day``. Days before ``last_day`` leave it unchanged (only
+    ``rebuild`` accounts for sessions inserted out of order)."""
+    last_day, current, longest = streak
+    if last_day is not None and day <= last_day:
+        return streak
+    current = current + 1 if last_day is not None and day == last_day + 1 else 1
+    return day, current, max(longest, current)
+
+
+def apply(connection, rows):
+    """Add inserted session rows ``(start, end, day, type, task, planned,
+    actual, pauses, completed)`` to the rollups; call inside the insert
+    transaction"""
+    for table, upsert in UPSERTS.items():
+        if table == "rollup_day":
+            keys = [row[2] for row in rows]
+        elif table == "rollup_week":
+            keys = [row[2] - (row[2] - 1) % 7 for row in rows]
+        else:
+            keys = [row[4] or "" for row in rows]
+        connection.executemany(upsert, [
+            (key, row[3], row[8], row[6], row[7]) for key, row in zip(keys, rows)
+        ])
+
+    streak = connection.execute(SELECT_STREAK).fetchone() or (None, 0, 0)
+    updated = streak
+    for row in rows:
+        if row[3] == WORK and row[8]:
+            updated = extend_streak(updated, row[2])
+    if updated != streak:
+        connection.execute(UPSERT_STREAK, updated)
+
+
+def recompute(connection):
+    """Rollups computed from scratch: ``{table: set of rows}`` and the streak"""
+    tables = {
+        table: set(connection.execute(RECOMPUTE_SQL.format(expression=expression)))
+        for table, (_, expression) in TABLES.items()
+    }
+    return tables, recompute_streak(connection)
+
+
+def recompute_streak(connection):
+    """Streak state ``(last_day, current, longest)`` computed from scratch"""
+    streak = (None, 0, 0)
+    for (day,) in connection.execute(STREAK_DAYS):
+        streak = extend_streak(streak, day)
+    return streak
+
+
+def stored(connection):
+    """The stored rollups, in the form returned by ``recompute``"""
+    tables = {
+        table: set(connection.execute(SELECT_SQL.format(table=table, key=key)))
+        for table, (key, _) in TABLES.items()
+    }
+    return tables, connection.execute(SELECT_STREAK).fetchone() or (None, 0, 0)
+
+
+def rebuild(connection):
+    """Replace all rollups with a from-scratch recompute"""
+    tables, streak = recompute(connection)
+    with connection:
+        for table, (key, _) in TABLES.items():
+            connection.execute(f"DELETE FROM {table}")
+            connection.executemany(
+                f"INSERT INTO {table} ({key}, type, sessions, completed, focus, pauses) VALUES (?, ?, ?, ?, ?, ?)",
+                tables[table]
+            )
+        connection.execute("DELETE FROM rollup_streak")
+        if streak[0] is not None:
+            connection.execute(UPSERT_STREAK, streak)
+
+
+def check(connection):
+    """Differences between the stored rollups and a recompute, as
+    ``(table, stored rows, expected rows)``; empty when consistent"""
+    expected_tables, expected_streak = recompute(connection)
+    stored_tables, stored_streak = stored(connection)
+    problems = []
+    for table in TABLES:
+        missing = expected_tables[table] - stored_tables[table]
+        extra = stored_tables[table] - expected_tables[table]
+        if missing or extra:
+            problems.append((table, sorted(extra, key=repr), sorted(missing, key=repr)))
+    if tuple(stored_streak) != tuple(expected_streak):
+        problems.append(("rollup_streak", [tuple(stored_streak)], [tuple(expected_streak)]))
+    return problems
+
+
+def main(argv=None):
+    from history_store import HISTORY_FILE
+
+    parser = argparse.ArgumentParser(description="Check or rebuild the history rollups")
+    parser.add_argument("command", choices=["check", "rebuild"])
+    parser.add_argument("database", nargs="?", default=HISTORY_FILE, help=f"history database (default: {HISTORY_FILE})")
+    args = parser.parse_args(argv)
+
+    connection = sqlite3.connect(args.database)
+    create(connection)
+    if args.command == "rebuild":
+        rebuild(connection)
+        print(f"Rollups of {args.database} rebuilt")
+        return 0
+    problems = check(connection)
+    for table, extra, missing in problems:
+        print(f"{table}: {len(extra)} stored rows differ from the {len(missing)} recomputed rows")
+        for row in extra[:5]:
+            print(f"  stored:   {row}")
+        for row in missing[:5]:
+            print(f"  expected: {row}")
+    if problems:
+        print(f"Rollups of {args.database} are inconsistent; run: python rollups.py rebuild")
+        return 1
+    print(f"Rollups of {args.database} are consistent")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""Timer scheduler.
+
+A single long-lived thread drives the ``TimerEngine``. The GUI (or any
+other front end) never touches the timing state directly; it sends
+``start``/``pause``/``reset`` commands through a queue, and the scheduler
+sleeps on that queue until either a command arrives or the displayed second
+changes. There is at most one timer loop per scheduler, however fast
+commands are sent.
+
+Time is read from a clock object (see ``clock``): elapsed time comes from
+the monotonic clock, and suspend is detected by comparing it with the
+boot-time clock and handled according to the suspend policy.
+"""
+
+import queue
+import threading
+
+from clock import SystemClock, SUSPEND_CONTINUE, SUSPEND_PAUSE, SUSPEND_POLICIES, SUSPEND_THRESHOLD
+
+START = "start"
+PAUSE = "pause"
+RESET = "reset"
+STOP = "stop"
+TICKS_ON = "ticks_on"  # Wake at every second boundary (window visible)
+TICKS_OFF = "ticks_off"  # Only wake for the end of the timer (window hidden)
+
+# Delay before a step that failed is retried, in seconds
+RETRY_SECONDS = 1.0
+
+# Longest sleep while ticks are off. The monotonic clock stops during
+# suspend, so without a cap a suspend would only be noticed at the end of
+# the timer.
+TICKS_OFF_MAX_SLEEP = 30.0
+
+
+class LatenessHistogram:
+    """Histogram of how late deadline wakeups happen, in milliseconds"""
+
+    BOUNDS_MS = (0.1, 0.5, 1, 2, 5, 10, 20, 50, 100)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self.total = 0
+        self.worst = 0.0
+
+    def add(self, lateness):
+        """Record a wakeup ``lateness`` seconds after its deadline"""
+        lateness_ms = max(0.0, lateness * 1000)
+        index = 0
+        while index < len(self.BOUNDS_MS) and lateness_ms > self.BOUNDS_MS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.total += 1
+        self.worst = max(self.worst, lateness_ms)
+
+    def format(self):
+        """Render the histogram as text"""
+        lines = []
+        lower = 0
+        for bound, count in zip(self.BOUNDS_MS + (None,), self.counts):
+            label = f"{lower:>5g}-{bound:<5g} ms" if bound is not None else f"  > {lower:<7g} ms"
+            share = count / self.total * 100 if self.total else 0.0
+            lines.append(f"{label} {count:6d} {share:6.1f}% {'#' * int(share / 2)}")
+            lower = bound
+        lines.append(f"worst: {self.worst:.3f} ms over {self.total} wakeups")
+        return "\n".join(lines)
+
+
+class TimerScheduler:
+    """Owns the timing state of a ``TimerEngine`` on one worker thread.
+
+    ``step`` holds all the timing logic and reads the time from ``clock``,
+    so the scheduler can also be driven without the worker thread, e.g. by
+    a simulation with a fake clock.
+    """
+
+    def __init__(self, engine, clock=None, suspend_policy=SUSPEND_CONTINUE):
+        if suspend_policy not in SUSPEND_POLICIES:
+            raise ValueError(f"Unknown suspend policy: {suspend_policy}")
+        self.engine = engine
+        self.clock = clock or SystemClock()
+        self.suspend_policy = suspend_policy
+        self.commands = queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+        # Timing of the current timer
+        self.start_time = None    # When the timer started, shifted by pauses
+        self.start_remaining = 0  # Seconds remaining at start_time
+        self.paused_at = None
+
+        # Last readings of both clocks, to detect suspend
+        self.last_monotonic = None
+        self.last_boottime = None
+        self.suspended_time = 0.0
+
+        # Whether to wake at every second boundary or only at the end
+        self.ticks = True
+
+        # Instrumentation: steps taken and how late deadline wakeups are
+        self.wakeups = 0
+        self.lateness = LatenessHistogram()
+
+    def start(self):
+        """Start the worker thread (once)"""
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name="TimerScheduler", daemon=True)
+                self.thread.start()
+
+    def stop(self, timeout=1.0):
+        """Stop the worker thread and wait for it to exit"""
+        self.commands.put(STOP)
+        if self.thread and self.thread.is_alive() and self.thread is not threading.current_thread():
+            self.thread.join(timeout)
+
+    def send(self, command):
+        """Queue a command for the worker thread"""
+        self.commands.put(command)
+
+    def step(self, command=None):
+        """Apply ``command`` (if any) and bring the engine up to date.
+
+        Returns the monotonic time of the next deadline, or ``None``.
+        """
+        self.wakeups += 1
+        now = self.clock.monotonic()
+        self.detect_suspend(now, self.clock.boottime())
+        if command:
+            # Bring the remaining time up to date before e.g. pausing
+            self.advance(now)
+            self.handle(command, now)
+        return self.advance(now)
+
+    def safe_step(self, command=None):
+        """``step`` for drivers: an error is reported instead of raised, and
+        a running timer is retried shortly so the driver keeps working"""
+        try:
+            return self.step(command)
+        except Exception as e:
+            print(f"Error in timer scheduler: {e!r}")
+            return self.clock.monotonic() + RETRY_SECONDS if self.engine.running else None
+
+    def detect_suspend(self, now, boottime):
+        """Apply the suspend policy if the machine was suspended since the
+        last reading"""
+        if self.last_monotonic is not None:
+            suspended = (boottime - self.last_boottime) - (now - self.last_monotonic)
+            if suspended >= SUSPEND_THRESHOLD:
+                self.suspended_time += suspended
+                self.on_suspend(suspended, now)
+        self.last_monotonic = now
+        self.last_boottime = boottime
+
+    def on_suspend(self, suspended, now):
+        """Handle ``suspended`` seconds of suspend that ended at ``now``"""
+        if not self.engine.running:
+            return
+        if self.suspend_policy == SUSPEND_CONTINUE:
+            # The monotonic clock skipped the suspend; count it anyway
+            self.start_time -= suspended
+        elif self.suspend_policy == SUSPEND_PAUSE:
+            self.advance(now)
+            self.handle(PAUSE, now)
+
+    def handle(self, command, now):
+        """Apply a control command at time ``now``"""
+        engine = self.engine
+        if command == START:
+            if engine.running:
+                return
+            if engine.paused and self.start_time is not None:
+                # Shift the start time by the paused duration
+                self.start_time += now - self.paused_at
+            else:
+                self.start_time = now
+                self.start_remaining = engine.time_remaining
+            self.paused_at = None
+            engine.start()
+        elif command == PAUSE:
+            if engine.running:
+                self.paused_at = now
+                engine.pause()
+        elif command == RESET:
+            self.start_time = None
+            self.paused_at = None
+            engine.reset()
+        elif command == TICKS_ON:
+            self.ticks = True
+        elif command == TICKS_OFF:
+            self.ticks = False
+
+    def advance(self, now):
+        """Bring the engine up to date at time ``now``.
+
+        Completes the timer when it reaches zero. Returns the time of the
+        next second boundary (or of the end of the timer when ticks are off,
+        at most ``TICKS_OFF_MAX_SLEEP`` away), or ``None`` when nothing is
+        running.
+        """
+        engine = self.engine
+        if not engine.running:
+            return None
+        elapsed = now - self.start_time
+        engine.set_remaining(max(0, self.start_remaining - int(elapsed)))
+        if engine.time_remaining > 0:
+            if not self.ticks:
+                return min(self.start_time + self.start_remaining, now + TICKS_OFF_MAX_SLEEP)
+            return self.start_time + int(elapsed) + 1
+        self.start_time = None
+        engine.complete()
+        return None
+
+    def run(self):
+        """Worker loop: sleep until the next deadline or command"""
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0, deadline - self.clock.monotonic())
+            try:
+                command = self.commands.get(timeout=timeout)
+            except queue.Empty:
+                command = None
+                self.lateness.add(self.clock.monotonic() - deadline)
+            if command == STOP:
+                break
+            deadline = self.safe_step(command)
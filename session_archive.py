@@ -0,0 +1,147 @@
+"""Fixed-width binary archive of finished sessions.
+
+Each session is one 24-byte little-endian record::
+
+    start     float64  wall clock time the timer was started
+    duration  uint32   seconds the timer ran (pauses excluded)
+    planned   uint32   full duration of the timer, in seconds
+    task      uint32   task id, 0 for none (names in ``<archive>.tasks.json``)
+    type      uint8    timer type code, see ``TYPE_CODES``
+    completed uint8    1 if completed, 0 if reset
+    pauses    uint16   number of pauses
+
+after a 16-byte header. ``load_archive`` maps the file with ``mmap`` and
+returns it as a NumPy structured array without copying or parsing, so whole
+history statistics run as vectorized operations; NumPy is optional and only
+needed for that. ``iter_archive`` reads the records without NumPy.
+
+Convert the live session log with::
+
+    python session_archive.py [sessions.jsonl] [sessions.pomarc]
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+
+from session_log import SESSION_LOG_FILE, SessionFolder, read_events
+from timer_engine import WORK, SHORT_BREAK, LONG_BREAK
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ARCHIVE_FILE = "sessions.pomarc"
+
+MAGIC = b"POMOARC\0"
+VERSION = 1
+HEADER = struct.Struct("<8sII")  # Magic, version, record size
+RECORD = struct.Struct("<dIIIBBH")
+
+TYPES = (WORK, SHORT_BREAK, LONG_BREAK)
+TYPE_CODES = {timer_type: code for code, timer_type in enumerate(TYPES)}
+
+# NumPy dtype of a record; field order and sizes must match RECORD
+DTYPE_FIELDS = [
+    ("start", "<f8"),
+    ("duration", "<u4"),
+    ("planned", "<u4"),
+    ("task", "<u4"),
+    ("type", "u1"),
+    ("completed", "u1"),
+    ("pauses", "<u2")
+]
+
+
+def tasks_path(path):
+    """Path of the task name table of an archive"""
+    return path + ".tasks.json"
+
+
+def write_archive(path, sessions):
+    """Write sessions (tuples as returned by ``SessionFolder.feed``) to an
+    archive, replacing it atomically; returns the number of records"""
+    task_ids = {}
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".archive-", suffix=".tmp", dir=directory)
+    count = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+            pack = RECORD.pack
+            for start, end, timer_type, task, planned, actual, pauses, completed in sessions:
+                task_id = 0 if task is None else task_ids.setdefault(task, len(task_ids) + 1)
+                f.write(pack(start, actual, planned, task_id, TYPE_CODES[timer_type], completed, min(pauses, 0xFFFF)))
+                count += 1
+            f.flush()
+            os.fsync(f.fileno())
+        with open(tasks_path(path), "w", encoding="utf-8") as f:
+            json.dump([None] + list(task_ids), f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return count
+
+
+def convert_log(log_path=SESSION_LOG_FILE, archive_path=ARCHIVE_FILE):
+    """Build an archive from the finished sessions of a session log"""
+    folder = SessionFolder()
+    return write_archive(archive_path, folder.feed(read_events(log_path)))
+
+
+def _read_header(buffer, path):
+    magic, version, record_size = HEADER.unpack_from(buffer)
+    if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+        raise ValueError(f"{path} is not a version {VERSION} session archive")
+
+
+def load_archive(path=ARCHIVE_FILE):
+    """The archive as a read-only NumPy structured array backed by the
+    mapped file (no copy)"""
+    if np is None:
+        raise ImportError("numpy is required to load a session archive as an array")
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _read_header(buffer, path)
+    count = (len(buffer) - HEADER.size) // RECORD.size
+    return np.frombuffer(buffer, dtype=np.dtype(DTYPE_FIELDS), count=count, offset=HEADER.size)
+
+
+def load_tasks(path=ARCHIVE_FILE):
+    """Task names by id (index 0 is ``None``)"""
+    try:
+        with open(tasks_path(path), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return [None]
+
+
+def iter_archive(path=ARCHIVE_FILE):
+    """Yield ``(start, duration, planned, task, type, completed, pauses)``
+    tuples without NumPy"""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        _read_header(buffer, path)
+        end = HEADER.size + (len(buffer) - HEADER.size) // RECORD.size * RECORD.size
+        yield from RECORD.iter_unpack(buffer[HEADER.size:end])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert the session log to a binary archive")
+    parser.add_argument("log", nargs="?", default=SESSION_LOG_FILE, help=f"session log (default: {SESSION_LOG_FILE})")
+    parser.add_argument("archive", nargs="?", default=ARCHIVE_FILE, help=f"archive to write (default: {ARCHIVE_FILE})")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    count = convert_log(args.log, args.archive)
+    elapsed = time.perf_counter() - started
+    print(f"{count} sessions written to {args.archive} in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Append-only session event log.
+
+Every timer transition (start, pause, resume, reset, complete) is appended
+to a JSON-lines file as one record::
+
+    {"event": "complete", "mono": 8123.52, "wall": 1760770000.41,
+     "type": "work", "planned": 1500, "actual": 1500}
+
+``mono`` and ``wall`` are the monotonic and wall clock times of the
+transition, ``planned`` the full duration of the timer and ``actual`` the
+seconds it had run so far (pauses excluded).
+
+The engine listener only puts the record on a queue. A writer thread
+appends batches of records and calls ``fsync`` at most once per
+``fsync_interval``, so a crash loses at most that much history, and a
+record torn by a crash is skipped when reading. The writer also passes each
+batch to the ``HistoryStore``, if one is given, in the same thread (after
+building its rollups if the history predates them).
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+
+from clock import SystemClock
+
+SESSION_LOG_FILE = "sessions.jsonl"
+
+# Longest time a written record may wait for fsync, in seconds
+FSYNC_SECONDS = 1.0
+
+# Engine event -> log event
+EVENTS = {
+    "started": "start",
+    "paused": "pause",
+    "resumed": "resume",
+    "reset": "reset",
+    "completed": "complete"
+}
+
+_STOP = object()
+
+
+class SessionLog:
+    """Record engine transitions to an append-only file off the timer thread"""
+
+    def __init__(self, path=SESSION_LOG_FILE, clock=None, fsync_interval=FSYNC_SECONDS, history=None):
+        self.path = path
+        self.clock = clock or SystemClock()
+        self.fsync_interval = fsync_interval
+        self.history = history
+        self.queue = queue.Queue()
+        self.engine = None
+        self.task = None  # Optional label of the task being worked on
+        self.active = False  # A timer has been started and not ended yet
+        self.thread = None
+
+        # Instrumentation
+        self.records_written = 0
+        self.fsyncs = 0
+
+    def attach(self, engine):
+        """Subscribe to ``engine`` and start the writer thread; returns self"""
+        self.engine = engine
+        engine.subscribe(self.on_engine_event)
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="session-log", daemon=True)
+            self.thread.start()
+        return self
+
+    def on_engine_event(self, event, data):
+        """Engine listener: queue a record for the writer (never blocks)"""
+        name = EVENTS.get(event)
+        if name is None:
+            return
+        if name == "start":
+            self.active = True
+        elif name in ("reset", "complete"):
+            if not self.active:
+                return  # Reset of a timer that was never started
+            self.active = False
+        planned = self.engine.durations[data["timer_type"]]
+        remaining = data.get("time_remaining", 0)
+        record = {
+            "event": name,
+            "mono": round(self.clock.monotonic(), 3),
+            "wall": round(self.clock.wall(), 3),
+            "type": data["timer_type"],
+            "planned": planned,
+            "actual": planned - remaining
+        }
+        if self.task is not None:
+            record["task"] = self.task
+        self.queue.put(record)
+
+    def run(self):
+        """Writer thread: append queued records, fsync in batches"""
+        try:
+            f = open(self.path, "a", encoding="utf-8")
+        except OSError as e:
+            print(f"Error opening session log: {e}")
+            return
+        with f:
+            if f.tell() > 0 and not self._ends_with_newline():
+                f.write("\n")  # Terminate a record torn by a crash
+            if self.history is not None:
+                # Build rollups for old history here rather than at startup;
+                # records queue up meanwhile
+                try:
+                    self.history.build_rollups()
+                except Exception as e:
+                    print(f"Error building history rollups: {e}")
+            sync_deadline = None
+            while True:
+                timeout = None if sync_deadline is None else max(0, sync_deadline - time.monotonic())
+                records = []
+                try:
+                    records.append(self.queue.get(timeout=timeout))
+                    while True:
+                        records.append(self.queue.get_nowait())
+                except queue.Empty:
+                    pass
+                stop = _STOP in records
+                records = [record for record in records if record is not _STOP]
+                lines = [json.dumps(record) + "\n" for record in records]
+                try:
+                    if lines:
+                        f.write("".join(lines))
+                        f.flush()
+                        self.records_written += len(lines)
+                        if sync_deadline is None:
+                            sync_deadline = time.monotonic() + self.fsync_interval
+                    if sync_deadline is not None and (stop or time.monotonic() >= sync_deadline):
+                        os.fsync(f.fileno())
+                        self.fsyncs += 1
+                        sync_deadline = None
+                except OSError as e:
+                    print(f"Error writing session log: {e}")
+                if self.history is not None and records:
+                    try:
+                        self.history.add_events(records)
+                    except Exception as e:
+                        print(f"Error saving session history: {e}")
+                if stop:
+                    return
+
+    def _ends_with_newline(self):
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def close(self, timeout=1.0):
+        """Write and fsync the queued records, then stop the writer"""
+        if self.thread is not None:
+            self.queue.put(_STOP)
+            self.thread.join(timeout)
+            self.thread = None
+
+
+class SessionFolder:
+    """Fold transition records into finished sessions.
+
+    ``feed`` returns ``(start, end, type, task, planned, actual, pauses,
+    completed)`` tuples with wall clock ``start``/``end``. A session still
+    running at the end of a batch is carried over to the next one.
+    """
+
+    def __init__(self):
+        self.open_session = None  # [start, type, task, planned, pauses]
+
+    def feed(self, records):
+        finished = []
+        for record in records:
+            event = record["event"]
+            if event == "start":
+                self.open_session = [record["wall"], record["type"], record.get("task"), record["planned"], 0]
+            elif self.open_session is None:
+                continue  # History started in the middle of a session
+            elif event == "pause":
+                self.open_session[4] += 1
+            elif event in ("complete", "reset"):
+                start, timer_type, task, planned, pauses = self.open_session
+                finished.append((
+                    start, record["wall"], timer_type, task, planned, record["actual"], pauses, event == "complete"
+                ))
+                self.open_session = None
+        return finished
+
+
+def read_events(path=SESSION_LOG_FILE):
+    """Yield the records of a session log, skipping torn or invalid lines"""
+    try:
+        f = open(path, "r", encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
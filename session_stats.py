@@ -0,0 +1,141 @@
+"""Dashboard statistics over the whole session history.
+
+All figures are computed with vectorized NumPy operations over the columns
+of the history (as returned by ``session_archive.load_archive``), with no
+per-session Python code:
+
+* focus minutes per day, week (starting Monday) and month,
+* completion rate of work sessions (completed vs reset),
+* average number of pauses per work session,
+* the hour of the day with the most focus time,
+* the current and longest streak of days with a completed work session.
+
+Days and hours are local time. Requires NumPy.
+"""
+
+import datetime
+import time
+
+import numpy as np
+
+import session_archive
+from timer_engine import WORK
+
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+def utc_offsets(starts):
+    """Local UTC offset, in seconds, at each timestamp.
+
+    The offset is looked up once per day, and once per hour on days where it
+    changes (daylight saving time), then broadcast to all timestamps.
+    """
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64)
+    first_hour = int(starts.min() // 3600)
+    hours = int(starts.max() // 3600) - first_hour + 1
+    day_starts = (first_hour + np.arange(0, hours + 24, 24)) * 3600
+    daily = np.array([time.localtime(t).tm_gmtoff for t in day_starts.tolist()], dtype=np.int64)
+    hourly = np.repeat(daily[:-1], 24)
+    for day in np.flatnonzero(daily[:-1] != daily[1:]).tolist():
+        for hour in range(day * 24, day * 24 + 24):
+            hourly[hour] = time.localtime((first_hour + hour) * 3600).tm_gmtoff
+    return hourly[(starts // 3600).astype(np.int64) - first_hour]
+
+
+def runs(days):
+    """Lengths of the runs of consecutive values in sorted unique ``days``,
+    and the last value of each run"""
+    breaks = np.flatnonzero(np.diff(days) != 1)
+    ends = np.append(breaks, len(days) - 1)
+    lengths = np.diff(np.append(-1, ends))
+    return lengths, days[ends]
+
+
+class SessionStats:
+    """Statistics over a history of sessions.
+
+    ``records`` is a structured array (or a mapping of column arrays) with
+    the ``start``, ``duration``, ``type``, ``completed`` and ``pauses``
+    columns of the session archive.
+    """
+
+    def __init__(self, records):
+        work = np.asarray(records["type"]) == session_archive.TYPE_CODES[WORK]
+        starts = np.asarray(records["start"])[work]
+        local = starts + utc_offsets(starts)
+        self.day = (local // 86400).astype(np.int64) + EPOCH_ORDINAL  # Date ordinals
+        self.hour = ((local % 86400) // 3600).astype(np.int64)
+        self.minutes = np.asarray(records["duration"])[work] / 60
+        self.completed = np.asarray(records["completed"])[work].astype(bool)
+        self.pauses = np.asarray(records["pauses"])[work]
+
+    @classmethod
+    def from_archive(cls, path=session_archive.ARCHIVE_FILE):
+        return cls(session_archive.load_archive(path))
+
+    def focus_minutes(self, period="day"):
+        """Focus minutes per ``"day"``, ``"week"`` or ``"month"``.
+
+        Returns ``(periods, minutes)`` arrays for the periods that have
+        focus time: date ordinals of the day or the Monday of the week, or
+        ``datetime64[M]`` months.
+        """
+        if period == "day":
+            keys = self.day
+        elif period == "week":
+            keys = self.day - (self.day - 1) % 7
+        elif period == "month":
+            keys = (self.day - EPOCH_ORDINAL).astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+        else:
+            raise ValueError(f"Unknown period: {period}")
+        if not len(keys):
+            if period == "month":
+                keys = keys.astype("datetime64[M]")
+            return keys, self.minutes
+        first = keys.min()
+        totals = np.bincount(keys - first, weights=self.minutes)
+        periods = np.flatnonzero(totals) + first
+        if period == "month":
+            periods = periods.astype("datetime64[M]")
+        return periods, totals[totals > 0]
+
+    def completion_rate(self):
+        """Fraction of work sessions that were completed rather than reset"""
+        return float(self.completed.mean()) if len(self.completed) else 0.0
+
+    def average_pauses(self):
+        """Average number of pauses per work session"""
+        return float(self.pauses.mean()) if len(self.pauses) else 0.0
+
+    def best_hour(self):
+        """Local hour of the day (0-23) with the most focus time, or ``None``"""
+        if not len(self.hour):
+            return None
+        return int(np.bincount(self.hour, weights=self.minutes, minlength=24).argmax())
+
+    def streaks(self, today=None):
+        """``(current, longest)`` streaks of days with a completed work
+        session; the current streak may end today or yesterday"""
+        days = np.unique(self.day[self.completed])
+        if not len(days):
+            return 0, 0
+        if today is None:
+            today = datetime.date.today().toordinal()
+        lengths, ends = runs(days)
+        current = int(lengths[-1]) if ends[-1] >= today - 1 else 0
+        return current, int(lengths.max())
+
+    def dashboard(self, today=None):
+        """All dashboard figures in one dict"""
+        current, longest = self.streaks(today)
+        return {
+            "daily": self.focus_minutes("day"),
+            "weekly": self.focus_minutes("week"),
+            "monthly": self.focus_minutes("month"),
+            "completion_rate": self.completion_rate(),
+            "average_pauses": self.average_pauses(),
+            "best_hour": self.best_hour(),
+            "current_streak": current,
+            "longest_streak": longest
+        }
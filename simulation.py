@@ -0,0 +1,166 @@
+"""Fast-forward simulation of the Pomodoro timer.
+
+Runs the real ``TimerEngine`` and ``TimerScheduler`` logic against a
+``FakeClock`` and a script of commands (start, pause, reset, suspend at
+given times), jumping the clock straight to the next interesting moment.
+A full day of sessions runs in milliseconds and produces a deterministic
+trace of transitions and notifications.
+
+Script format, one command per line (``#`` starts a comment)::
+
+    00:00:00 start
+    00:10:00 pause
+    00:12:30 start
+    01:00:00 suspend 600
+
+Usage::
+
+    python simulation.py script.txt --hours 8 --auto-start
+"""
+
+import argparse
+import math
+import sys
+import time
+
+from clock import FakeClock, SUSPEND_CONTINUE, SUSPEND_POLICIES
+from scheduler import TimerScheduler, START, PAUSE, RESET
+from timer_engine import TimerEngine
+
+SUSPEND = "suspend"
+COMMANDS = (START, PAUSE, RESET, SUSPEND)
+
+# Simulated time is moved just past each deadline so that float rounding
+# never leaves a second boundary unreached
+EPSILON = 1e-6
+
+
+def parse_time(text):
+    """Parse ``HH:MM:SS``, ``MM:SS`` or plain seconds"""
+    seconds = 0.0
+    for part in text.split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def parse_script(text):
+    """Parse a script into a list of ``(seconds, command, argument)``"""
+    script = []
+    for number, line in enumerate(text.splitlines(), 1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        parts = line.split()
+        if len(parts) < 2 or parts[1] not in COMMANDS:
+            raise ValueError(f"line {number}: expected '<time> <{'|'.join(COMMANDS)}> [seconds]'")
+        argument = parse_time(parts[2]) if len(parts) > 2 else None
+        script.append((parse_time(parts[0]), parts[1], argument))
+    return script
+
+
+def format_timestamp(seconds):
+    """Format simulated seconds as ``HH:MM:SS.mmm``"""
+    whole = int(seconds)
+    return f"{whole // 3600:02d}:{whole % 3600 // 60:02d}:{whole % 60:02d}.{int((seconds - whole) * 1000):03d}"
+
+
+class Simulation:
+    """Drive an engine and scheduler with simulated time.
+
+    With ``ticks=False`` (the default) the clock jumps directly from one
+    command or completion to the next and per-second ticks are not traced;
+    with ``ticks=True`` every second boundary is visited. With
+    ``auto_start`` the next timer is started as soon as one completes, as a
+    user who always presses Start straight away would.
+    """
+
+    def __init__(self, durations=None, total_sessions=4, suspend_policy=SUSPEND_CONTINUE,
+                 auto_start=False, ticks=False):
+        self.clock = FakeClock()
+        self.engine = TimerEngine(durations, total_sessions)
+        self.scheduler = TimerScheduler(self.engine, self.clock, suspend_policy)
+        self.auto_start = auto_start
+        self.ticks = ticks
+        self.trace = []  # (simulated seconds, event, data)
+        self.engine.subscribe(self.record)
+
+    def record(self, event, data):
+        """Engine listener appending to the trace"""
+        if event == "tick" and not self.ticks:
+            return
+        self.trace.append((self.clock.monotonic(), event, data))
+        if event == "completed":
+            # The GUI shows one notification per completed timer
+            self.trace.append((self.clock.monotonic(), "notification", {"timer_type": data["next_timer_type"]}))
+
+    def next_deadline(self, deadline):
+        """Time the clock should jump to when no command comes first"""
+        if not self.engine.running:
+            return math.inf
+        if self.ticks:
+            return deadline + EPSILON
+        scheduler = self.scheduler
+        return scheduler.start_time + scheduler.start_remaining + EPSILON
+
+    def run(self, script, until):
+        """Run ``script`` up to ``until`` simulated seconds; returns the trace"""
+        script = sorted(script, key=lambda item: item[0])
+        index = 0
+        deadline = self.scheduler.step()
+        while True:
+            command_time = script[index][0] if index < len(script) else math.inf
+            target = min(self.next_deadline(deadline), command_time)
+            if target > until:
+                self.clock.advance(max(0, until - self.clock.now))
+                self.scheduler.step()
+                break
+            self.clock.advance(max(0, target - self.clock.now))
+            command = None
+            if target == command_time:
+                _, command, argument = script[index]
+                index += 1
+                if command == SUSPEND:
+                    self.clock.suspend(argument or 0)
+                    command = None
+            deadline = self.scheduler.step(command)
+            if self.auto_start and not self.engine.running and not self.engine.paused and self.trace \
+                    and self.trace[-1][1] == "notification":
+                deadline = self.scheduler.step(START)
+        return self.trace
+
+
+def format_trace(trace):
+    """Render a trace as text, one event per line"""
+    lines = []
+    for seconds, event, data in trace:
+        details = " ".join(f"{key}={value}" for key, value in data.items())
+        lines.append(f"{format_timestamp(seconds)} {event} {details}".rstrip())
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fast-forward Pomodoro simulation")
+    parser.add_argument("script", help="command script file, or - for stdin")
+    parser.add_argument("--hours", type=float, default=8, help="simulated duration (default: 8)")
+    parser.add_argument("--auto-start", action="store_true", help="start each timer as soon as the previous one ends")
+    parser.add_argument("--ticks", action="store_true", help="visit and trace every second")
+    parser.add_argument("--suspend-policy", choices=SUSPEND_POLICIES, default=SUSPEND_CONTINUE)
+    args = parser.parse_args(argv)
+
+    if args.script == "-":
+        text = sys.stdin.read()
+    else:
+        with open(args.script, "r") as f:
+            text = f.read()
+
+    simulation = Simulation(suspend_policy=args.suspend_policy, auto_start=args.auto_start, ticks=args.ticks)
+    started = time.perf_counter()
+    trace = simulation.run(parse_script(text), args.hours * 3600)
+    elapsed = time.perf_counter() - started
+    print(format_trace(trace))
+    print(f"# {len(trace)} events, {simulation.engine.completed_sessions} work sessions, "
+          f"simulated {args.hours:g} h in {elapsed * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
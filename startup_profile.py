@@ -0,0 +1,105 @@
+"""Startup timing report.
+
+Enabled with ``--profile-startup``: records the time of each startup phase
+and prints a report once the first frame has been drawn, including an
+``-X importtime``-style breakdown of the modules imported on the way.
+"""
+
+import builtins
+import sys
+import threading
+import time
+
+# Imports faster than this are left out of the report, in milliseconds
+IMPORT_REPORT_MIN_MS = 1.0
+
+
+class StartupProfiler:
+    """Collects named timestamps during startup"""
+
+    def __init__(self, enabled=False, imports=None):
+        self.enabled = enabled
+        self.imports = imports
+        self.start = time.perf_counter() if imports is None else imports.start
+        self.marks = []  # (label, seconds since start)
+        self.notes = []
+        if imports is not None:
+            self.mark("module imports")
+
+    def mark(self, label):
+        """Record the end of a startup phase"""
+        if self.enabled:
+            self.marks.append((label, time.perf_counter() - self.start))
+
+    def note(self, text):
+        """Add a line of extra information to the report"""
+        if self.enabled:
+            self.notes.append(text)
+
+    def report(self):
+        """Print the phases with their duration and cumulative time"""
+        if not self.enabled:
+            return
+        print("Startup profile:")
+        previous = 0.0
+        for label, elapsed in self.marks:
+            print(f"  {label:<28} {(elapsed - previous) * 1000:8.1f} ms  (total {elapsed * 1000:8.1f} ms)")
+            previous = elapsed
+        for text in self.notes:
+            print(f"  {text}")
+        if self.imports is not None:
+            self.imports.report()
+
+
+class ImportProfiler:
+    """Times the first import of each module, like ``python -X importtime``.
+
+    Must be installed before the imports to measure. Only ``import``
+    statements run on the main thread are timed.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.original_import = None
+        self.children = []  # Time spent in nested imports, per active import
+        self.imports = []   # (module, self seconds, cumulative seconds, depth)
+
+    def install(self):
+        """Start timing imports; returns self"""
+        if self.enabled and self.original_import is None:
+            self.original_import = builtins.__import__
+            builtins.__import__ = self.timed_import
+        return self
+
+    def uninstall(self):
+        """Stop timing imports"""
+        if self.original_import is not None:
+            builtins.__import__ = self.original_import
+            self.original_import = None
+
+    def timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules or threading.current_thread() is not threading.main_thread():
+            return self.original_import(name, globals, locals, fromlist, level)
+        self.children.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self.original_import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = time.perf_counter() - start
+            nested = self.children.pop()
+            if self.children:
+                self.children[-1] += cumulative
+            self.imports.append((name, cumulative - nested, cumulative, len(self.children)))
+
+    def report(self, min_ms=IMPORT_REPORT_MIN_MS):
+        """Print the import tree (children before their parent)"""
+        if not self.enabled:
+            return
+        total = sum(cumulative for _, _, cumulative, depth in self.imports if depth == 0)
+        print(f"Imports ({len(self.imports)} modules, {total * 1000:.1f} ms; "
+              f"showing those over {min_ms:g} ms):")
+        print(f"  {'self [ms]':>10} | {'cumulative':>10} | module")
+        for name, own, cumulative, depth in self.imports:
+            if cumulative * 1000 >= min_ms:
+                print(f"  {own * 1000:10.1f} | {cumulative * 1000:10.1f} | {'  ' * depth}{name}")
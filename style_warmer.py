@@ -0,0 +1,41 @@
+"""Idle-time pre-building of ttkbootstrap styles.
+
+ttkbootstrap builds a bootstyle (and its images) the first time a widget
+uses it. For styles that are only reached later, such as the break colors
+applied when a session ends, that work would happen on the hot path. The
+``StyleWarmer`` builds them ahead of time, one style per idle callback so
+the window stays responsive.
+"""
+
+from ttkbootstrap.style import Bootstyle, Style
+
+
+class StyleWarmer:
+    """Build a list of ttk styles (e.g. ``"info.Horizontal.TProgressbar"``)
+    in the current theme while the application is idle.
+
+    Styles built this way are registered with ttkbootstrap, which rebuilds
+    them as part of any later theme change.
+    """
+
+    def __init__(self, root, ttkstyles):
+        self.root = root
+        self.ttkstyles = list(ttkstyles)
+        self.built = 0
+
+    def start(self):
+        """Start warming once the application is idle"""
+        self.queue = list(self.ttkstyles)
+        self.root.after_idle(self.step)
+
+    def step(self):
+        """Build the next style, then yield back to the event loop"""
+        style = Style.get_instance()
+        while self.queue:
+            ttkstyle = self.queue.pop(0)
+            if not style.style_exists_in_theme(ttkstyle):
+                Bootstyle.update_ttk_widget_style(None, ttkstyle)
+                self.built += 1
+                break
+        if self.queue:
+            self.root.after_idle(self.step)
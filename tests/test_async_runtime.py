@@ -0,0 +1,110 @@
+import asyncio
+import os
+import tkinter as tk
+
+import async_runtime
+from async_runtime import AsyncRuntime
+
+
+class FakeTk:
+    """Tk interpreter whose events arrive on a pipe standing in for the X
+    connection"""
+
+    def __init__(self, fd, windowing_system="x11"):
+        self.fd = fd
+        self.windowing_system = windowing_system
+        self.pumps = 0
+        self.handled = []
+        self.pending_after = ""
+
+    def dooneevent(self, flags):
+        self.pumps += 1
+        try:
+            data = os.read(self.fd, 1)
+        except BlockingIOError:
+            return 0
+        self.handled.append(data)
+        return 1
+
+    def call(self, *args):
+        if args == ("tk", "windowingsystem"):
+            return self.windowing_system
+        if args == ("after", "info"):
+            return self.pending_after
+        raise AssertionError(args)
+
+
+class FakeRoot:
+    def __init__(self, fd, windowing_system="x11"):
+        self.tk = FakeTk(fd, windowing_system)
+        self.destroyed = False
+
+    def winfo_exists(self):
+        if self.destroyed:
+            raise tk.TclError("application has been destroyed")
+        return 1
+
+
+def run_with_pipe(monkeypatch, windowing_system, script):
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    root = FakeRoot(read_fd, windowing_system)
+    if windowing_system == "x11":
+        monkeypatch.setattr(async_runtime, "display_fd", lambda root: read_fd)
+    runtime = AsyncRuntime(root)
+
+    errors = []
+
+    async def drive():
+        try:
+            await script(runtime, write_fd)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            root.destroyed = True
+            runtime.wake()
+
+    runtime.spawn(drive)
+    try:
+        runtime.run()
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+    if errors:
+        raise errors[0]
+    return root.tk
+
+
+def test_idle_window_is_not_polled(monkeypatch):
+    async def script(runtime, write_fd):
+        root = runtime.root
+        await asyncio.sleep(0.3)
+        pumps = root.tk.pumps
+        assert pumps == 1  # Only the initial pass while nothing happened
+        os.write(write_fd, b"x")
+        await asyncio.sleep(0.05)
+        assert root.tk.handled == [b"x"]
+        assert root.tk.pumps - pumps <= 3
+
+    run_with_pipe(monkeypatch, "x11", script)
+
+
+def test_pending_tk_timers_are_polled(monkeypatch):
+    async def script(runtime, write_fd):
+        fake = runtime.root.tk
+        fake.pending_after = "after#1"
+        runtime.wake()
+        await asyncio.sleep(0.01)
+        pumps = fake.pumps
+        await asyncio.sleep(0.3)
+        assert fake.pumps - pumps >= 5
+
+    run_with_pipe(monkeypatch, "x11", script)
+
+
+def test_other_windowing_systems_are_polled(monkeypatch):
+    async def script(runtime, write_fd):
+        await asyncio.sleep(0.3)
+        assert runtime.root.tk.pumps >= 5
+
+    run_with_pipe(monkeypatch, "aqua", script)
@@ -0,0 +1,111 @@
+"""DBusNotifier against a private session bus.
+
+Starts its own ``dbus-daemon --session`` with a stand-in
+org.freedesktop.Notifications service; skipped when dbus-daemon or jeepney
+is not installed.
+"""
+
+import shutil
+import subprocess
+import threading
+
+import pytest
+
+jeepney = pytest.importorskip("jeepney")
+if shutil.which("dbus-daemon") is None:
+    pytest.skip("dbus-daemon is not installed", allow_module_level=True)
+
+from jeepney import HeaderFields, MessageType, new_method_return  # noqa: E402
+from jeepney.bus_messages import message_bus  # noqa: E402
+from jeepney.io.blocking import open_dbus_connection  # noqa: E402
+
+from notifications import APP_NAME, DBusNotifier, NotificationDispatcher  # noqa: E402
+
+
+class NotificationService:
+    """Stand-in notification server recording the Notify calls"""
+
+    def __init__(self, address):
+        self.connection = open_dbus_connection(bus=address)
+        self.connection.send_and_get_reply(message_bus.RequestName("org.freedesktop.Notifications"))
+        self.calls = []
+        self.received = threading.Event()
+        self.gate = threading.Event()  # Cleared to hold replies back
+        self.gate.set()
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        next_id = 1
+        while self.running:
+            try:
+                message = self.connection.receive(timeout=0.1)
+            except TimeoutError:
+                continue
+            header = message.header
+            if header.message_type != MessageType.method_call or header.fields.get(HeaderFields.member) != "Notify":
+                continue
+            self.calls.append(message.body)
+            self.received.set()
+            self.gate.wait(5)
+            replaces_id = message.body[1]
+            if replaces_id == 0:
+                replaces_id, next_id = next_id, next_id + 1
+            self.connection.send(new_method_return(message, "u", (replaces_id,)))
+
+    def close(self):
+        self.running = False
+        self.gate.set()
+        self.thread.join(1)
+        self.connection.close()
+
+
+@pytest.fixture
+def bus_address():
+    daemon = subprocess.Popen(
+        ["dbus-daemon", "--session", "--nofork", "--print-address"],
+        stdout=subprocess.PIPE, text=True
+    )
+    try:
+        yield daemon.stdout.readline().strip()
+    finally:
+        daemon.terminate()
+        daemon.wait(5)
+
+
+@pytest.fixture
+def service(bus_address):
+    service = NotificationService(bus_address)
+    yield service
+    service.close()
+
+
+def test_notifications_reuse_the_previous_bubble(bus_address, service):
+    notifier = DBusNotifier(bus=bus_address)
+    try:
+        notifier("Work", "Time to take a break!")
+        notifier("Break", "Time to get back to work!")
+    finally:
+        notifier.close()
+    assert [call[0] for call in service.calls] == [APP_NAME, APP_NAME]
+    assert [call[1] for call in service.calls] == [0, 1]  # replaces_id
+    assert [call[3:5] for call in service.calls] == [
+        ("Work", "Time to take a break!"),
+        ("Break", "Time to get back to work!")
+    ]
+
+
+def test_dispatcher_deduplicates_pending_notifications(bus_address, service):
+    dispatcher = NotificationDispatcher(DBusNotifier(bus=bus_address), timeout=5)
+    service.gate.clear()
+    assert dispatcher.post("A", "first")
+    assert service.received.wait(5)  # "A" is being sent and held by the service
+    assert dispatcher.post("B", "second")
+    assert not dispatcher.post("B", "second")
+    assert not dispatcher.post("B", "second")
+    service.gate.set()
+    dispatcher.close(5)
+    assert [call[3] for call in service.calls] == ["A", "B"]
+    assert dispatcher.stats()["deduplicated"] == 2
+    assert dispatcher.sent == 2
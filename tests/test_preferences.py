@@ -0,0 +1,95 @@
+import json
+import os
+import time
+
+import preferences
+from preferences import PreferencesStore, DEFAULT_PREFERENCES
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def read(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def test_burst_of_changes_is_written_once(tmp_path):
+    path = str(tmp_path / "preferences.json")
+    store = PreferencesStore(path, debounce=0.05)
+    for volume in range(10, 60, 10):
+        store.update(volume=volume)
+    store.update(volume=50)  # Unchanged: neither written nor counted
+    assert wait_for(lambda: store.writes == 1)
+    time.sleep(0.1)
+    assert store.writes == 1
+    assert store.writes_avoided == 4
+    assert read(path) == dict(DEFAULT_PREFERENCES, volume=50)
+
+
+def test_write_waits_for_a_quiet_period(tmp_path):
+    path = str(tmp_path / "preferences.json")
+    store = PreferencesStore(path, debounce=0.2)
+    store.update(volume=10)
+    time.sleep(0.15)
+    store.update(volume=20)
+    time.sleep(0.1)  # Past the first timer, within the quiet period of the second change
+    assert store.writes == 0 and not os.path.exists(path)
+    assert wait_for(lambda: store.writes == 1)
+    assert read(path)["volume"] == 20
+
+
+def test_close_writes_pending_changes(tmp_path):
+    path = str(tmp_path / "preferences.json")
+    store = PreferencesStore(path, debounce=60)
+    store.update(theme="flatly", language="fr")
+    store.close()
+    assert store.writes == 1 and store.timer is None
+    loaded = PreferencesStore(path).load()
+    assert (loaded["theme"], loaded["language"], loaded["volume"]) == ("flatly", "fr", 50)
+
+
+def test_failed_write_keeps_the_old_file_and_no_temporary(tmp_path, monkeypatch):
+    path = str(tmp_path / "preferences.json")
+    store = PreferencesStore(path, debounce=60)
+    store.update(volume=10)
+    store.flush()
+
+    def failing_replace(source, destination):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(preferences.os, "replace", failing_replace)
+    store.update(volume=20)
+    store.flush()
+    assert store.writes == 1
+    assert os.listdir(tmp_path) == ["preferences.json"]
+    assert read(path)["volume"] == 10
+
+
+class FakeStorage:
+    def __init__(self, saved=None):
+        self.saved = saved
+        self.written = []
+
+    def read_preferences(self):
+        return self.saved
+
+    def write_preferences(self, values):
+        self.written.append(values)
+
+
+def test_storage_takes_over_from_the_json_file(tmp_path):
+    path = str(tmp_path / "preferences.json")
+    with open(path, "w") as f:
+        json.dump({"theme": "flatly"}, f)
+    storage = FakeStorage()
+    store = PreferencesStore(path, debounce=60, storage=storage).load()
+    assert store["theme"] == "flatly"  # Carried over while the storage is empty
+    store.update(volume=30)
+    store.close()
+    assert storage.written == [dict(DEFAULT_PREFERENCES, theme="flatly", volume=30)]
+    assert PreferencesStore(path, storage=FakeStorage({"theme": "cosmo"})).load()["theme"] == "cosmo"
@@ -0,0 +1,134 @@
+import pytest
+
+from clock import FakeClock, SUSPEND_CONTINUE, SUSPEND_FREEZE, SUSPEND_PAUSE
+from scheduler import TimerScheduler, START, PAUSE, RESET, TICKS_OFF, TICKS_OFF_MAX_SLEEP
+from simulation import Simulation, parse_script
+from timer_engine import TimerEngine, WORK, SHORT_BREAK
+
+DURATIONS = {WORK: 60, SHORT_BREAK: 10, "long_break": 30}
+
+
+def make_scheduler(policy=SUSPEND_CONTINUE):
+    clock = FakeClock()
+    engine = TimerEngine(DURATIONS)
+    return clock, engine, TimerScheduler(engine, clock, policy)
+
+
+def test_step_returns_next_second_boundary():
+    clock, engine, scheduler = make_scheduler()
+    assert scheduler.step(START) == 1
+    clock.advance(1.5)
+    assert scheduler.step() == 2
+    assert engine.time_remaining == 59
+
+
+def test_pause_does_not_count_paused_time():
+    clock, engine, scheduler = make_scheduler()
+    scheduler.step(START)
+    clock.advance(10.2)
+    scheduler.step(PAUSE)
+    assert engine.time_remaining == 50
+    clock.advance(100)
+    assert scheduler.step() is None
+    scheduler.step(START)
+    clock.advance(20)
+    scheduler.step()
+    assert engine.time_remaining == 30
+
+
+def test_completion_moves_to_the_break():
+    clock, engine, scheduler = make_scheduler()
+    scheduler.step(START)
+    clock.advance(60)
+    assert scheduler.step() is None
+    assert engine.current_timer_type == SHORT_BREAK
+    assert engine.completed_sessions == 1
+
+
+def test_reset_stops_the_timer():
+    clock, engine, scheduler = make_scheduler()
+    scheduler.step(START)
+    clock.advance(5)
+    assert scheduler.step(RESET) is None
+    assert not engine.running
+    assert engine.time_remaining == 60
+
+
+@pytest.mark.parametrize("policy, remaining, running", [
+    (SUSPEND_CONTINUE, 30, True),
+    (SUSPEND_FREEZE, 50, True),
+    (SUSPEND_PAUSE, 50, False)
+])
+def test_suspend_policies(policy, remaining, running):
+    clock, engine, scheduler = make_scheduler(policy)
+    scheduler.step(START)
+    clock.advance(10)
+    scheduler.step()
+    clock.suspend(20)
+    scheduler.step()
+    assert engine.time_remaining == remaining
+    assert engine.running == running
+
+
+@pytest.mark.parametrize("policy", [SUSPEND_CONTINUE, SUSPEND_PAUSE])
+def test_suspend_is_noticed_while_ticks_are_off(policy):
+    clock = FakeClock()
+    engine = TimerEngine({WORK: 1500, SHORT_BREAK: 300, "long_break": 900})
+    scheduler = TimerScheduler(engine, clock, policy)
+    completed_at = []
+    engine.subscribe(lambda event, data: event == "completed" and completed_at.append(clock.boottime()))
+    scheduler.step(START)
+    deadline = scheduler.step(TICKS_OFF)
+    while deadline <= 100:
+        clock.advance(deadline - clock.monotonic())
+        deadline = scheduler.step()
+    clock.advance(100 - clock.monotonic())
+    clock.suspend(3600)
+    clock.advance(deadline - clock.monotonic())  # The driver wakes at its deadline
+    scheduler.step()
+    assert clock.boottime() <= 100 + 3600 + TICKS_OFF_MAX_SLEEP
+    if policy == SUSPEND_CONTINUE:
+        assert completed_at == [clock.boottime()]
+    else:
+        assert completed_at == [] and engine.paused
+        assert engine.time_remaining == 1500 - int(clock.monotonic())
+
+
+def test_safe_step_survives_errors():
+    clock, engine, scheduler = make_scheduler()
+    scheduler.step(START)
+
+    def broken(command, now):
+        raise RuntimeError("boom")
+
+    scheduler.handle = broken
+    clock.advance(0.5)
+    assert scheduler.safe_step(PAUSE) == pytest.approx(1.5)
+    assert engine.running
+
+
+def test_simulation_is_deterministic():
+    script = parse_script("""
+        00:00 start
+        00:20 pause
+        00:30 start
+        02:00 suspend 15
+    """)
+    traces = [Simulation(DURATIONS, auto_start=True).run(script, 600) for _ in range(2)]
+    assert traces[0] == traces[1]
+    completed = [data["timer_type"] for _, event, data in traces[0] if event == "completed"]
+    assert completed[:3] == [WORK, SHORT_BREAK, WORK]
+    # The first work session completes 10 paused seconds late
+    first = next(seconds for seconds, event, _ in traces[0] if event == "completed")
+    assert first == pytest.approx(70, abs=1e-3)
+
+
+def test_simulation_with_a_raising_listener():
+    simulation = Simulation(DURATIONS, auto_start=True)
+
+    def broken(event, data):
+        raise ValueError(event)
+
+    simulation.engine.subscribe(broken)
+    trace = simulation.run(parse_script("00:00 start"), 300)
+    assert sum(1 for _, event, _ in trace if event == "completed") >= 4
@@ -0,0 +1,101 @@
+import struct
+
+import pytest
+
+from clock import FakeClock
+from session_archive import (
+    DTYPE_FIELDS, HEADER, RECORD, TYPE_CODES, convert_log, iter_archive, load_archive, load_tasks, write_archive
+)
+from session_log import SessionLog
+from timer_engine import TimerEngine, WORK, SHORT_BREAK, LONG_BREAK
+
+SESSIONS = [
+    (1_700_000_000.5, 1_700_001_500.5, WORK, None, 1500, 1500, 0, True),
+    (1_700_001_600.25, 1_700_001_700.0, SHORT_BREAK, "email", 300, 100, 2, False),
+    (1_700_002_000.0, 1_700_002_900.0, LONG_BREAK, "review", 900, 900, 70000, True),
+    (1_700_003_000.0, 1_700_004_500.0, WORK, "email", 1500, 1500, 1, True)
+]
+
+# (start, duration, planned, task, type, completed, pauses) as stored
+RECORDS = [
+    (1_700_000_000.5, 1500, 1500, 0, TYPE_CODES[WORK], 1, 0),
+    (1_700_001_600.25, 100, 300, 1, TYPE_CODES[SHORT_BREAK], 0, 2),
+    (1_700_002_000.0, 900, 900, 2, TYPE_CODES[LONG_BREAK], 1, 0xFFFF),  # Pauses saturate
+    (1_700_003_000.0, 1500, 1500, 1, TYPE_CODES[WORK], 1, 1)
+]
+
+
+def test_record_and_dtype_layouts_agree():
+    np = pytest.importorskip("numpy")
+    dtype = np.dtype(DTYPE_FIELDS)
+    assert RECORD.size == dtype.itemsize == 24
+    # Each field starts where the struct format puts it
+    codes = RECORD.format.lstrip("<")
+    offsets = [struct.calcsize("<" + codes[:i]) for i in range(len(codes))]
+    assert [dtype.fields[name][1] for name, _ in DTYPE_FIELDS] == offsets
+
+
+def test_write_then_iterate(tmp_path):
+    path = str(tmp_path / "sessions.pomarc")
+    assert write_archive(path, SESSIONS) == 4
+    assert list(iter_archive(path)) == RECORDS
+    assert load_tasks(path) == [None, "email", "review"]
+    assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+
+
+def test_write_then_load(tmp_path):
+    pytest.importorskip("numpy")
+    path = str(tmp_path / "sessions.pomarc")
+    write_archive(path, SESSIONS)
+    array = load_archive(path)
+    assert [tuple(row.item()) for row in array] == RECORDS
+    assert not array.flags.writeable
+
+
+def test_convert_log_from_a_session_log(tmp_path):
+    log_path = str(tmp_path / "sessions.jsonl")
+    archive_path = str(tmp_path / "sessions.pomarc")
+    clock = FakeClock(0, 1_700_000_000)
+    engine = TimerEngine()
+    log = SessionLog(log_path, clock, fsync_interval=0).attach(engine)
+    log.task = "writing"
+    engine.start()
+    clock.advance(600)
+    engine.pause()
+    engine.start()
+    clock.advance(900)
+    engine.complete()
+    log.task = None
+    engine.start()
+    clock.advance(100)
+    engine.set_remaining(200)
+    engine.reset()
+    log.close()
+
+    assert convert_log(log_path, archive_path) == 2
+    assert list(iter_archive(archive_path)) == [
+        (1_700_000_000.0, 1500, 1500, 1, TYPE_CODES[WORK], 1, 1),
+        (1_700_001_500.0, 100, 300, 0, TYPE_CODES[SHORT_BREAK], 0, 0)
+    ]
+    assert load_tasks(archive_path) == [None, "writing"]
+
+
+def write_bad_header(tmp_path):
+    path = str(tmp_path / "sessions.pomarc")
+    write_archive(path, SESSIONS)
+    with open(path, "r+b") as f:
+        f.write(HEADER.pack(b"POMOARC\0", 2, RECORD.size))
+    return path
+
+
+def test_bad_header_is_rejected(tmp_path):
+    path = write_bad_header(tmp_path)
+    with pytest.raises(ValueError):
+        list(iter_archive(path))
+
+
+def test_bad_header_is_rejected_by_load(tmp_path):
+    pytest.importorskip("numpy")
+    path = write_bad_header(tmp_path)
+    with pytest.raises(ValueError):
+        load_archive(path)
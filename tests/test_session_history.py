@@ -0,0 +1,112 @@
+import rollups
+from clock import FakeClock
+from history_store import HistoryStore
+from session_log import SessionFolder, SessionLog, read_events
+from timer_engine import TimerEngine, WORK, SHORT_BREAK
+
+
+def record(event, wall, timer_type=WORK, actual=0, planned=1500):
+    return {"event": event, "wall": wall, "type": timer_type, "planned": planned, "actual": actual}
+
+
+def test_folder_builds_sessions_across_batches():
+    folder = SessionFolder()
+    assert folder.feed([record("pause", 0), record("start", 10), record("pause", 20)]) == []
+    assert folder.feed([record("resume", 30), record("complete", 1600, actual=1500)]) == [
+        (10, 1600, WORK, None, 1500, 1500, 1, True)
+    ]
+    assert folder.feed([record("start", 1700, SHORT_BREAK, planned=300),
+                        record("reset", 1750, SHORT_BREAK, actual=50, planned=300)]) == [
+        (1700, 1750, SHORT_BREAK, None, 300, 50, 0, False)
+    ]
+
+
+def test_session_log_writes_transitions_and_skips_torn_records(tmp_path):
+    path = str(tmp_path / "sessions.jsonl")
+    engine = TimerEngine()
+    log = SessionLog(path, FakeClock(100, 1_000_000), fsync_interval=0).attach(engine)
+    engine.reset()  # Not started: not logged
+    engine.start()
+    engine.set_remaining(1400)
+    engine.pause()
+    log.close()
+    with open(path, "a") as f:
+        f.write('{"event": "sta')  # Torn by a crash
+    engine = TimerEngine()
+    log = SessionLog(path).attach(engine)
+    engine.start()
+    log.close()
+    events = [(item["event"], item["actual"]) for item in read_events(path)]
+    assert events == [("start", 0), ("pause", 100), ("start", 0)]
+
+
+def test_log_records_survive_a_raising_listener(tmp_path):
+    path = str(tmp_path / "sessions.jsonl")
+    engine = TimerEngine()
+
+    def broken(event, data):
+        raise KeyError("resume")
+
+    engine.subscribe(broken)
+    log = SessionLog(path).attach(engine)
+    engine.start()
+    engine.pause()
+    engine.start()
+    engine.complete()
+    log.close()
+    assert [item["event"] for item in read_events(path)] == ["start", "pause", "resume", "complete"]
+
+
+def test_rollups_stay_consistent_and_check_detects_drift(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.sqlite3"))
+    day = 86400
+    store.add_sessions([
+        (1_700_000_000 + i * day, 1_700_001_500 + i * day, WORK, "review" if i % 2 else None, 1500, 1500, i % 3, True)
+        for i in range(10)
+    ])
+    store.add_sessions([(1_700_000_000, 1_700_000_100, SHORT_BREAK, None, 300, 100, 0, False)])
+    assert store.check_rollups() == []
+    assert store.streak(today=rollups_last_day(store))[1] == 10
+
+    store.connection.execute("UPDATE rollup_day SET focus = focus + 1 WHERE rowid = 1")
+    store.connection.commit()
+    assert [problem[0] for problem in store.check_rollups()] == ["rollup_day"]
+    store.rebuild_rollups()
+    assert store.check_rollups() == []
+    store.close()
+
+
+def rollups_last_day(store):
+    return store.connection.execute(rollups.SELECT_STREAK).fetchone()[0]
+
+
+def test_rollups_of_old_history_are_built_off_the_startup_path(tmp_path):
+    path = str(tmp_path / "history.sqlite3")
+    day = 86400
+    store = HistoryStore(path)
+    store.add_sessions([
+        (1_700_000_000 + i * day, 1_700_001_500 + i * day, WORK, "review" if i % 2 else None, 1500, 1500, 0, i != 4)
+        for i in range(8)
+    ])
+    expected = {by: store.totals(by) for by in ("day", "week", "task")}
+    expected_first = store.totals("day", expected["day"][3][0])
+    today = rollups_last_day(store)
+    expected_streak = store.streak(today)
+    for table in list(rollups.TABLES) + ["rollup_streak"]:
+        store.connection.execute(f"DELETE FROM {table}")  # As written before rollups existed
+    store.connection.commit()
+    store.close()
+
+    store = HistoryStore(path)
+    assert not store.rollups_ready
+    assert {by: store.totals(by) for by in ("day", "week", "task")} == expected
+    assert store.totals("day", expected["day"][3][0]) == expected_first
+    assert store.streak(today) == expected_streak == (3, 4)
+    store.add_sessions([(1_700_000_000 + 8 * day, 1_700_001_500 + 8 * day, WORK, None, 1500, 1500, 0, True)])
+
+    log = SessionLog(str(tmp_path / "sessions.jsonl"), history=store).attach(TimerEngine())
+    log.close()  # The writer thread builds the rollups first
+    assert store.rollups_ready
+    assert store.check_rollups() == []
+    assert store.streak(today + 1) == (4, 4)
+    store.close()
@@ -0,0 +1,115 @@
+import datetime
+import os
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from session_archive import TYPE_CODES  # noqa: E402
+from session_stats import SessionStats, runs, utc_offsets  # noqa: E402
+from timer_engine import WORK, SHORT_BREAK  # noqa: E402
+
+# Central European time; summer time starts 2024-03-31 at 02:00 local
+DST_ZONE = "CET-1CEST,M3.5.0,M10.5.0/3"
+
+
+@pytest.fixture
+def timezone():
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is not available")
+    previous = os.environ.get("TZ")
+    os.environ["TZ"] = DST_ZONE
+    time.tzset()
+    yield
+    if previous is None:
+        del os.environ["TZ"]
+    else:
+        os.environ["TZ"] = previous
+    time.tzset()
+
+
+def timestamp(*fields):
+    return datetime.datetime(*fields).timestamp()
+
+
+def columns(sessions):
+    """Column dict from ``(start, minutes, type, completed, pauses)`` tuples"""
+    return {
+        "start": np.array([s[0] for s in sessions], dtype=np.float64),
+        "duration": np.array([s[1] * 60 for s in sessions], dtype=np.uint32),
+        "type": np.array([TYPE_CODES[s[2]] for s in sessions], dtype=np.uint8),
+        "completed": np.array([s[3] for s in sessions], dtype=np.uint8),
+        "pauses": np.array([s[4] for s in sessions], dtype=np.uint16)
+    }
+
+
+def test_days_and_hours_match_local_time_across_dst(timezone):
+    starts = np.arange(timestamp(2024, 3, 29, 12), timestamp(2024, 4, 2), 1800.0)
+    expected = [datetime.datetime.fromtimestamp(t) for t in starts.tolist()]
+    offsets = utc_offsets(starts)
+    assert sorted(set(offsets.tolist())) == [3600, 7200]
+    stats = SessionStats(columns([(t, 25, WORK, 1, 0) for t in starts.tolist()]))
+    assert stats.day.tolist() == [moment.toordinal() for moment in expected]
+    assert stats.hour.tolist() == [moment.hour for moment in expected]
+
+
+def test_focus_minutes_by_period(timezone):
+    stats = SessionStats(columns([
+        (timestamp(2024, 3, 24, 23, 30), 25, WORK, 1, 0),  # Sunday
+        (timestamp(2024, 3, 25, 9), 25, WORK, 1, 0),  # Monday
+        (timestamp(2024, 3, 25, 10), 5, SHORT_BREAK, 1, 0),  # Not focus time
+        (timestamp(2024, 3, 31, 10), 20, WORK, 0, 1),  # Sunday, after the DST change
+        (timestamp(2024, 4, 1, 9), 25, WORK, 1, 0)
+    ]))
+    days, minutes = stats.focus_minutes("day")
+    assert [datetime.date.fromordinal(day) for day in days.tolist()] == [
+        datetime.date(2024, 3, 24), datetime.date(2024, 3, 25), datetime.date(2024, 3, 31), datetime.date(2024, 4, 1)
+    ]
+    assert minutes.tolist() == [25, 25, 20, 25]
+    weeks, minutes = stats.focus_minutes("week")
+    assert [datetime.date.fromordinal(week) for week in weeks.tolist()] == [
+        datetime.date(2024, 3, 18), datetime.date(2024, 3, 25), datetime.date(2024, 4, 1)
+    ]
+    assert all(datetime.date.fromordinal(week).weekday() == 0 for week in weeks.tolist())
+    assert minutes.tolist() == [25, 45, 25]
+    months, minutes = stats.focus_minutes("month")
+    assert months.tolist() == [datetime.date(2024, 3, 1), datetime.date(2024, 4, 1)]
+    assert minutes.tolist() == [70, 25]
+    assert stats.best_hour() == 9
+    assert stats.completion_rate() == 0.75
+    assert stats.average_pauses() == 0.25
+
+
+def test_runs_with_gaps():
+    lengths, ends = runs(np.array([3, 4, 5, 7, 10, 11]))
+    assert lengths.tolist() == [3, 1, 2]
+    assert ends.tolist() == [5, 7, 11]
+    lengths, ends = runs(np.array([42]))
+    assert (lengths.tolist(), ends.tolist()) == ([1], [42])
+
+
+def test_streaks_with_gaps(timezone):
+    def work(day, completed=1):
+        return (timestamp(2024, 5, day, 10), 25, WORK, completed, 0)
+
+    # Completed on 1-3 and 6-7; the reset on the 5th does not count
+    stats = SessionStats(columns([work(1), work(2), work(2), work(3), work(5, 0), work(6), work(7)]))
+    may = datetime.date(2024, 5, 1).toordinal() - 1
+    assert stats.streaks(today=may + 7) == (2, 3)
+    assert stats.streaks(today=may + 8) == (2, 3)  # Today not done yet
+    assert stats.streaks(today=may + 9) == (0, 3)
+
+
+def test_empty_history():
+    stats = SessionStats(columns([]))
+    for period in ("day", "week"):
+        periods, minutes = stats.focus_minutes(period)
+        assert len(periods) == len(minutes) == 0
+    months, minutes = stats.focus_minutes("month")
+    assert months.dtype == np.dtype("datetime64[M]") and len(months) == 0
+    assert stats.completion_rate() == 0.0
+    assert stats.average_pauses() == 0.0
+    assert stats.best_hour() is None
+    assert stats.streaks(today=738976) == (0, 0)
+    assert stats.dashboard(today=738976)["longest_streak"] == 0
@@ -0,0 +1,100 @@
+"""ThemeAssetCache record and replay.
+
+The wrapper logic is tested with a fake builder. The full round trip
+through ttkbootstrap needs a display and is skipped without one.
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+pytest.importorskip("ttkbootstrap")
+
+from theme_cache import ThemeAssetCache  # noqa: E402
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class FakeTk:
+    def call(self, *args):
+        return {"scaling": "1.0", "windowingsystem": "x11"}[args[1]]
+
+
+class FakeBuilder:
+    def __init__(self):
+        self.style = type("Style", (), {"master": type("Root", (), {"tk": FakeTk()})()})()
+        self.theme = type("Theme", (), {"name": "darkly"})()
+        self.theme_images = {}
+
+
+def test_wrapper_records_then_replays(tmp_path):
+    cache = ThemeAssetCache(str(tmp_path))
+    calls = []
+
+    def create_example_assets(builder, color, size=10):
+        calls.append((color, size))
+        return ("plain", [1, 2])
+
+    wrapper = cache._wrap("create_example_assets", create_example_assets)
+    builder = FakeBuilder()
+    assert wrapper(builder, "#fff", size=12) == ("plain", [1, 2])
+    assert wrapper(builder, "#fff", size=12) == ("plain", (1, 2))
+    assert calls == [("#fff", 12)]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.save()
+    reloaded = ThemeAssetCache(str(tmp_path))
+    wrapper = reloaded._wrap("create_example_assets", create_example_assets)
+    assert wrapper(FakeBuilder(), "#fff", size=12) == ("plain", (1, 2))
+    assert (reloaded.hits, reloaded.misses) == (1, 0)
+
+
+def test_arguments_that_are_not_json_are_built_uncached(tmp_path):
+    cache = ThemeAssetCache(str(tmp_path))
+    calls = []
+
+    def create_example_assets(builder, color):
+        calls.append(color)
+        return "result"
+
+    wrapper = cache._wrap("create_example_assets", create_example_assets)
+    color = object()
+    assert wrapper(FakeBuilder(), color) == "result"
+    assert wrapper(FakeBuilder(), color) == "result"
+    assert len(calls) == 2
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+BUILD_THEME = textwrap.dedent("""
+    import sys
+    sys.path.insert(0, {repository!r})
+    from theme_cache import ThemeAssetCache
+    import ttkbootstrap as ttk
+
+    cache = ThemeAssetCache({directory!r}).install()
+    root = ttk.Window(themename="darkly")
+    ttk.Scale(root).pack()
+    ttk.Checkbutton(root, bootstyle="round-toggle").pack()
+    root.update()
+    cache.save()
+    print(cache.hits, cache.misses, len(root.style.theme_names()))
+    root.destroy()
+""")
+
+
+@pytest.mark.skipif(not os.environ.get("DISPLAY") and sys.platform.startswith("linux"), reason="needs a display")
+def test_real_theme_round_trip(tmp_path):
+    script = BUILD_THEME.format(repository=REPOSITORY, directory=str(tmp_path))
+
+    def build():
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+        hits, misses, _ = map(int, output.split())
+        return hits, misses
+
+    hits, misses = build()
+    assert hits == 0 and misses > 0
+    hits, misses = build()
+    assert hits > 0 and misses == 0
@@ -0,0 +1,14 @@
+from time_format import TimeStringTable, HHMMSS, MMSS, format_hhmmss, format_mmss
+
+
+def test_table_matches_formatter():
+    table = TimeStringTable(3600, HHMMSS)
+    for seconds in (0, 59, 60, 3599, 3600):
+        assert table.format(seconds) == format_hhmmss(seconds)
+    assert table.format(3661) == "01:01:01"  # Beyond the table
+
+
+def test_mmss_format():
+    table = TimeStringTable(1500, MMSS)
+    assert table.format(1500) == "25:00"
+    assert format_mmss(3725) == "62:05"
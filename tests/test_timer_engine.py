@@ -0,0 +1,50 @@
+from timer_engine import TimerEngine, WORK, SHORT_BREAK, LONG_BREAK
+
+
+def test_cycle_ends_with_long_break_every_fourth_work_session():
+    engine = TimerEngine(total_sessions=4)
+    types = []
+    for _ in range(8):
+        types.append(engine.complete())
+    assert types == [SHORT_BREAK, WORK, SHORT_BREAK, WORK, SHORT_BREAK, WORK, LONG_BREAK, WORK]
+    assert engine.completed_sessions == 4
+
+
+def test_reset_reports_the_abandoned_timer():
+    engine = TimerEngine()
+    events = []
+    engine.subscribe(lambda event, data: events.append((event, data)))
+    engine.complete()
+    engine.start()
+    engine.set_remaining(100)
+    engine.reset()
+    assert events[-1] == ("reset", {"timer_type": SHORT_BREAK, "time_remaining": 100})
+    assert engine.current_timer_type == WORK
+    assert engine.time_remaining == engine.durations[WORK]
+
+
+def test_pause_and_resume_events():
+    engine = TimerEngine()
+    events = []
+    engine.subscribe(lambda event, data: events.append(event))
+    engine.start()
+    engine.pause()
+    engine.pause()  # Ignored: not running
+    engine.start()
+    assert events == ["started", "paused", "resumed"]
+
+
+def test_raising_listener_does_not_stop_other_listeners():
+    engine = TimerEngine()
+    seen = []
+
+    def broken(event, data):
+        raise KeyError("resume")
+
+    engine.subscribe(broken)
+    engine.subscribe(lambda event, data: seen.append(event))
+    engine.start()
+    engine.pause()
+    assert engine.complete() == SHORT_BREAK
+    assert seen == ["started", "paused", "completed"]
+    assert engine.listener_errors == 3
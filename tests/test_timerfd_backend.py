@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+import timerfd_backend
+from scheduler import TimerScheduler, START
+from timer_engine import TimerEngine, WORK, SHORT_BREAK
+
+DURATIONS = {WORK: 60, SHORT_BREAK: 10, "long_break": 30}
+
+
+class FakeTk:
+    def __init__(self):
+        self.handlers = {}
+
+    def createfilehandler(self, fd, mask, handler):
+        self.handlers[fd] = handler
+
+    def deletefilehandler(self, fd):
+        del self.handlers[fd]
+
+
+class FakeRoot:
+    def __init__(self):
+        self.tk = FakeTk()
+
+
+def test_timerfd_creation_error_falls_back_to_the_thread(monkeypatch):
+    def unavailable():
+        raise OSError(38, "Function not implemented")
+
+    monkeypatch.setattr(timerfd_backend, "TimerFD", unavailable)
+    engine = TimerEngine(DURATIONS)
+    started = []
+    engine.subscribe(lambda event, data: started.append(event == "started"))
+    scheduler = TimerScheduler(engine)
+    driver = timerfd_backend.TimerfdDriver(FakeRoot(), scheduler)
+    driver.start()
+    assert driver.fallback and scheduler.thread.is_alive()
+    driver.send(START)
+    deadline = time.monotonic() + 2
+    while not started and time.monotonic() < deadline:
+        time.sleep(0.01)
+    driver.stop()
+    assert started == [True]
+    assert not scheduler.thread.is_alive()
+
+
+@pytest.mark.skipif(not timerfd_backend.is_available(), reason="timerfd is Linux only")
+def test_deadline_lateness_is_recorded_on_the_scheduler():
+    engine = TimerEngine(DURATIONS)
+    scheduler = TimerScheduler(engine)
+    root = FakeRoot()
+    driver = timerfd_backend.TimerfdDriver(root, scheduler)
+    driver.start()
+    try:
+        driver.arm(time.monotonic() + 0.01)
+        time.sleep(0.05)
+        root.tk.handlers[driver.timerfd.fileno()](driver.timerfd.fileno(), None)
+    finally:
+        driver.stop()
+    assert scheduler.lateness.total == 1
+    assert root.tk.handlers == {}
@@ -0,0 +1,72 @@
+from ui_dispatcher import UIDispatcher, PixelProgress
+
+
+class FakeRoot:
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, func):
+        self.callbacks.append(func)
+
+    def run(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for func in callbacks:
+            func()
+
+
+class FakeWidget:
+    def __init__(self):
+        self.configured = []
+
+    def configure(self, **options):
+        self.configured.append(options)
+
+
+def test_updates_are_coalesced_and_unchanged_options_skipped():
+    root = FakeRoot()
+    ui = UIDispatcher(root)
+    label = FakeWidget()
+    ui.configure(label, text="a")
+    ui.configure(label, text="b")
+    assert len(root.callbacks) == 1
+    root.run()
+    assert label.configured == [{"text": "b"}]
+    ui.configure(label, text="b")
+    root.run()
+    assert label.configured == [{"text": "b"}]
+    assert ui.updates_skipped == 1
+
+
+def test_hidden_window_renders_once_when_shown():
+    root = FakeRoot()
+    ui = UIDispatcher(root)
+    label = FakeWidget()
+    ui.set_visible(False)
+    for text in "abc":
+        ui.configure(label, text=text)
+    assert root.callbacks == []
+    ui.set_visible(True)
+    root.run()
+    assert label.configured == [{"text": "c"}]
+
+
+def test_forget_reapplies_options():
+    root = FakeRoot()
+    ui = UIDispatcher(root)
+    label = FakeWidget()
+    ui.configure(label, text="a")
+    root.run()
+    ui.forget()
+    ui.configure(label, text="a")
+    root.run()
+    assert label.configured == [{"text": "a"}, {"text": "a"}]
+
+
+def test_pixel_progress_moves_once_per_pixel():
+    progress = PixelProgress(width=100)
+    values = [progress.update(elapsed, 1500) for elapsed in range(1501)]
+    moves = [value for value in values if value is not None]
+    assert len(moves) == 101
+    assert moves[0] == 0 and moves[-1] == 100
+    progress.resize(200)
+    assert progress.update(1500, 1500) == 100
@@ -0,0 +1,217 @@
+"""On-disk cache of generated ttkbootstrap theme images.
+
+ttkbootstrap draws the element images of its styles (scale handles,
+checkbuttons, toggles, scrollbar thumbs, arrows...) with PIL every time a
+theme is built. ``ThemeAssetCache`` wraps the ``create_*_assets`` methods
+of ``StyleBuilderTTK``: the first time an asset set is built its images are
+recorded as PNG data, and on later launches they are loaded from the cache
+instead of being drawn again.
+
+The cache is keyed by theme name, ttkbootstrap version and Tk scaling (DPI),
+so a new ttkbootstrap release or a different screen never reuses stale
+images.
+
+The cache patches private ttkbootstrap methods, so it is opt-in
+(``--theme-cache``).
+"""
+
+import base64
+import io
+import json
+import os
+import tempfile
+import tkinter as tk
+
+from PIL import ImageTk
+from ttkbootstrap.style import StyleBuilderTTK
+
+# Bump when the cache file layout changes
+CACHE_VERSION = 1
+
+
+def default_cache_dir():
+    """Per-user cache directory for the application"""
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pomodoro_timer", "themes")
+
+
+def ttkbootstrap_version():
+    """Installed ttkbootstrap version, used in the cache key"""
+    try:
+        from importlib.metadata import version
+        return version("ttkbootstrap")
+    except Exception:
+        return "unknown"
+
+
+class ThemeAssetCache:
+    """Record and replay the images built by ``StyleBuilderTTK``"""
+
+    def __init__(self, directory=None):
+        self.base_directory = directory or default_cache_dir()
+        self.directory = None  # Known once Tk exists, see bind()
+        self.root = None
+        self.entries = {}  # theme -> {call key: entry}
+        self.dirty = set()
+        self.recording = False
+        self.originals = {}
+
+        # Instrumentation
+        self.hits = 0
+        self.misses = 0
+
+    def bind(self, root):
+        """Select the cache directory matching the scaling of ``root``"""
+        if self.root is root:
+            return
+        scaling = float(root.tk.call("tk", "scaling"))
+        winsys = root.tk.call("tk", "windowingsystem")
+        self.root = root
+        self.directory = os.path.join(
+            self.base_directory,
+            f"v{CACHE_VERSION}-ttkbootstrap-{ttkbootstrap_version()}-{winsys}-{scaling:.4f}"
+        )
+        self.entries = {}
+
+    def install(self):
+        """Wrap the asset builders of ``StyleBuilderTTK``.
+
+        Must be called before the window is created so that the first theme
+        build goes through the cache.
+        """
+        for name in dir(StyleBuilderTTK):
+            if name.startswith("create_") and name.endswith("_assets") and name not in self.originals:
+                original = getattr(StyleBuilderTTK, name)
+                self.originals[name] = original
+                setattr(StyleBuilderTTK, name, self._wrap(name, original))
+        return self
+
+    def uninstall(self):
+        """Restore the original asset builders"""
+        for name, original in self.originals.items():
+            setattr(StyleBuilderTTK, name, original)
+        self.originals = {}
+
+    def _wrap(self, method_name, original):
+        cache = self
+
+        def wrapper(builder, *args, **kwargs):
+            if cache.recording:
+                # Nested call: the outer recording captures these images
+                return original(builder, *args, **kwargs)
+            cache.bind(builder.style.master)
+            theme = builder.theme.name
+            try:
+                key = json.dumps([method_name, args, sorted(kwargs.items())])
+            except TypeError:
+                # Arguments that can't be part of a key; build uncached
+                return original(builder, *args, **kwargs)
+            entry = cache.theme_entries(theme).get(key)
+            if entry is not None:
+                try:
+                    result = cache.replay(builder, entry)
+                    cache.hits += 1
+                    return result
+                except Exception as e:
+                    print(f"Error replaying theme cache, rebuilding: {e}")
+            cache.misses += 1
+            return cache.record(builder, theme, key, original, args, kwargs)
+
+        wrapper.__name__ = method_name
+        wrapper.__doc__ = original.__doc__
+        return wrapper
+
+    def path(self, theme):
+        return os.path.join(self.directory, f"{theme}.json")
+
+    def theme_entries(self, theme):
+        """Cached entries of a theme, loaded from disk on first use"""
+        if theme not in self.entries:
+            entries = {}
+            try:
+                with open(self.path(theme), "r") as f:
+                    entries = json.load(f)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Error loading theme cache: {e}")
+            self.entries[theme] = entries
+        return self.entries[theme]
+
+    def record(self, builder, theme, key, original, args, kwargs):
+        """Build the assets and remember their images"""
+        created = []
+        real_photo_image = ImageTk.PhotoImage
+
+        def recording_photo_image(image=None, *photo_args, **photo_kwargs):
+            photo = real_photo_image(image, *photo_args, **photo_kwargs)
+            created.append((photo, image))
+            return photo
+
+        ImageTk.PhotoImage = recording_photo_image
+        self.recording = True
+        try:
+            result = original(builder, *args, **kwargs)
+        finally:
+            ImageTk.PhotoImage = real_photo_image
+            self.recording = False
+
+        try:
+            images = []
+            indexes = {}
+            for photo, image in created:
+                if not hasattr(image, "save"):
+                    return result  # Not built from a PIL image; don't cache
+                buffer = io.BytesIO()
+                image.save(buffer, format="PNG")
+                indexes[str(photo)] = len(images)
+                images.append(base64.b64encode(buffer.getvalue()).decode("ascii"))
+            self.theme_entries(theme)[key] = {
+                "images": images,
+                "result": self._template(result, indexes)
+            }
+            self.dirty.add(theme)
+        except Exception as e:
+            # The theme itself was built; only caching it failed
+            print(f"Error recording theme cache: {e}")
+        return result
+
+    def replay(self, builder, entry):
+        """Create the cached images and return the builder's result"""
+        names = []
+        for data in entry["images"]:
+            photo = tk.PhotoImage(master=self.root, data=data, format="png")
+            builder.theme_images[photo.name] = photo
+            names.append(photo.name)
+        return self._fill(entry["result"], names)
+
+    def _template(self, value, indexes):
+        # Replace image names in a builder result by their index
+        if isinstance(value, (tuple, list)):
+            return {"$seq": [self._template(item, indexes) for item in value]}
+        if isinstance(value, str) and value in indexes:
+            return {"$image": indexes[value]}
+        return value
+
+    def _fill(self, template, names):
+        if isinstance(template, dict) and "$seq" in template:
+            return tuple(self._fill(item, names) for item in template["$seq"])
+        if isinstance(template, dict) and "$image" in template:
+            return names[template["$image"]]
+        return template
+
+    def save(self):
+        """Write the themes with new entries to disk (atomically)"""
+        for theme in sorted(self.dirty):
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+                with os.fdopen(fd, "w") as f:
+                    json.dump(self.entries[theme], f)
+                os.replace(tmp_path, self.path(theme))
+            except Exception as e:
+                print(f"Error saving theme cache: {e}")
+        self.dirty.clear()
@@ -0,0 +1,44 @@
+"""Timer display strings.
+
+``TimeStringTable`` renders the display string of every second up to the
+longest timer once, so formatting on each UI tick is a tuple lookup.
+"""
+
+import sys
+
+HHMMSS = "hh:mm:ss"
+MMSS = "mm:ss"
+FORMATS = (HHMMSS, MMSS)
+
+
+def format_hhmmss(seconds):
+    """Format seconds into HH:MM:SS"""
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    secs = seconds % 60
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+def format_mmss(seconds):
+    """Format seconds into MM:SS (minutes may exceed 59)"""
+    minutes, secs = divmod(seconds, 60)
+    return f"{minutes:02d}:{secs:02d}"
+
+
+FORMATTERS = {HHMMSS: format_hhmmss, MMSS: format_mmss}
+
+
+class TimeStringTable:
+    """Precomputed display strings for 0..max_seconds"""
+
+    def __init__(self, max_seconds, display_format=HHMMSS):
+        self.formatter = FORMATTERS[display_format]
+        self.display_format = display_format
+        self.max_seconds = max_seconds
+        self.strings = tuple(sys.intern(self.formatter(seconds)) for seconds in range(max_seconds + 1))
+
+    def format(self, seconds):
+        """Display string for ``seconds``"""
+        if 0 <= seconds <= self.max_seconds:
+            return self.strings[seconds]
+        return self.formatter(seconds)
@@ -0,0 +1,139 @@
+"""Headless Pomodoro timer engine.
+
+The engine owns the work -> short break -> long break cycle and the
+running/paused state, and emits events to its subscribers. It has no
+dependency on Tk, so the same engine can be driven by the GUI, the command
+line, a server or a benchmark.
+"""
+
+WORK = "work"
+SHORT_BREAK = "short_break"
+LONG_BREAK = "long_break"
+
+# Timer durations in seconds
+DEFAULT_DURATIONS = {
+    WORK: 25 * 60,
+    SHORT_BREAK: 5 * 60,
+    LONG_BREAK: 15 * 60
+}
+
+
+class TimerEngine:
+    """Pomodoro state machine.
+
+    Listeners are called as ``listener(event, data)`` where ``event`` is one
+    of ``"started"``, ``"paused"``, ``"resumed"``, ``"reset"``, ``"tick"`` or
+    ``"completed"`` and ``data`` is a dict describing the transition.
+    Listeners run on whichever thread drives the engine.
+    """
+
+    def __init__(self, durations=None, total_sessions=4):
+        self.durations = dict(durations or DEFAULT_DURATIONS)
+        self.total_sessions = total_sessions
+        self.completed_sessions = 0
+        self.current_timer_type = WORK
+        self.time_remaining = self.durations[WORK]
+        self.running = False
+        self.paused = False
+        self.listeners = []
+        self.listener_errors = 0
+
+    def subscribe(self, listener):
+        """Register a listener and return it"""
+        self.listeners.append(listener)
+        return listener
+
+    def unsubscribe(self, listener):
+        """Remove a previously registered listener"""
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def emit(self, event, **data):
+        """Notify all listeners of an event.
+
+        A listener that raises is reported and skipped, so it can neither
+        keep the other listeners from seeing the event nor break the thread
+        driving the engine.
+        """
+        for listener in tuple(self.listeners):
+            try:
+                listener(event, data)
+            except Exception as e:
+                self.listener_errors += 1
+                print(f"Error in {event!r} listener {getattr(listener, '__qualname__', listener)}: {e!r}")
+
+    @property
+    def duration(self):
+        """Planned duration of the current timer, in seconds"""
+        return self.durations[self.current_timer_type]
+
+    @property
+    def progress(self):
+        """Progress of the current timer as a percentage (0-100)"""
+        return 100 - (self.time_remaining / self.duration * 100)
+
+    def start(self):
+        """Start a new timer or resume a paused one"""
+        if self.running:
+            return
+        resumed = self.paused
+        self.running = True
+        self.paused = False
+        self.emit(
+            "resumed" if resumed else "started",
+            timer_type=self.current_timer_type,
+            time_remaining=self.time_remaining
+        )
+
+    def pause(self):
+        """Pause the running timer"""
+        if not self.running:
+            return
+        self.running = False
+        self.paused = True
+        self.emit("paused", timer_type=self.current_timer_type, time_remaining=self.time_remaining)
+
+    def reset(self):
+        """Stop the timer and go back to the start of a work session"""
+        abandoned = self.current_timer_type
+        remaining = self.time_remaining
+        self.running = False
+        self.paused = False
+        self.current_timer_type = WORK
+        self.time_remaining = self.durations[WORK]
+        self.emit("reset", timer_type=abandoned, time_remaining=remaining)
+
+    def set_remaining(self, seconds):
+        """Update the remaining time, emitting ``tick`` when it changes"""
+        if seconds != self.time_remaining:
+            self.time_remaining = seconds
+            self.emit("tick", timer_type=self.current_timer_type, time_remaining=seconds)
+
+    def next_timer_type(self):
+        """Timer type that follows the current one once it completes"""
+        if self.current_timer_type != WORK:
+            return WORK
+        if (self.completed_sessions + 1) % self.total_sessions == 0:
+            return LONG_BREAK
+        return SHORT_BREAK
+
+    def complete(self):
+        """Finish the current timer and move to the next one in the cycle.
+
+        Returns the new timer type.
+        """
+        finished = self.current_timer_type
+        next_type = self.next_timer_type()
+        if finished == WORK:
+            self.completed_sessions += 1
+        self.running = False
+        self.paused = False
+        self.current_timer_type = next_type
+        self.time_remaining = self.durations[next_type]
+        self.emit(
+            "completed",
+            timer_type=finished,
+            next_timer_type=next_type,
+            completed_sessions=self.completed_sessions
+        )
+        return next_type
@@ -0,0 +1,137 @@
+"""Linux timerfd wakeup backend.
+
+Instead of a worker thread sleeping on a queue, ``TimerfdDriver`` runs the
+``TimerScheduler`` on the Tk main thread: a ``timerfd`` is armed for the
+exact next deadline (the next second boundary or the end of the session)
+and registered with Tk through ``createfilehandler``, so the application
+wakes exactly when needed and nowhere else.
+
+``os.timerfd_create`` is used on Python 3.13+; older versions call the libc
+functions through ctypes.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import sys
+import tkinter as tk
+
+CLOCK_MONOTONIC = 1
+TFD_NONBLOCK = 0o4000
+TFD_CLOEXEC = 0o2000000
+TFD_TIMER_ABSTIME = 1
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+class _Itimerspec(ctypes.Structure):
+    _fields_ = [("it_interval", _Timespec), ("it_value", _Timespec)]
+
+
+def is_available():
+    """Whether timerfd can be used on this system"""
+    return sys.platform.startswith("linux")
+
+
+class TimerFD:
+    """A CLOCK_MONOTONIC timerfd armed with absolute deadlines"""
+
+    def __init__(self):
+        if hasattr(os, "timerfd_create"):
+            self.libc = None
+            self.fd = os.timerfd_create(CLOCK_MONOTONIC, flags=TFD_NONBLOCK | TFD_CLOEXEC)
+        else:
+            self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            self.libc.timerfd_create.argtypes = [ctypes.c_int, ctypes.c_int]
+            self.libc.timerfd_settime.argtypes = [
+                ctypes.c_int, ctypes.c_int, ctypes.POINTER(_Itimerspec), ctypes.POINTER(_Itimerspec)
+            ]
+            self.fd = self.libc.timerfd_create(CLOCK_MONOTONIC, TFD_NONBLOCK | TFD_CLOEXEC)
+            if self.fd < 0:
+                errno = ctypes.get_errno()
+                raise OSError(errno, os.strerror(errno))
+
+    def fileno(self):
+        return self.fd
+
+    def arm(self, deadline):
+        """Fire once at ``deadline`` (seconds on the monotonic clock);
+        ``None`` disarms the timer"""
+        deadline_ns = 0 if deadline is None else max(1, int(deadline * 1e9))
+        if self.libc is None:
+            os.timerfd_settime_ns(self.fd, flags=TFD_TIMER_ABSTIME, initial=deadline_ns)
+            return
+        spec = _Itimerspec()
+        spec.it_value.tv_sec, spec.it_value.tv_nsec = divmod(deadline_ns, 1_000_000_000)
+        if self.libc.timerfd_settime(self.fd, TFD_TIMER_ABSTIME, ctypes.byref(spec), None) < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+    def read(self):
+        """Acknowledge expirations; returns how many happened"""
+        try:
+            return int.from_bytes(os.read(self.fd, 8), sys.byteorder)
+        except BlockingIOError:
+            return 0
+
+    def close(self):
+        os.close(self.fd)
+
+
+class TimerfdDriver:
+    """Drive a ``TimerScheduler`` from the Tk event loop with a timerfd.
+
+    Offers the same ``start``/``send``/``stop`` interface as the scheduler's
+    worker thread. Commands must be sent from the Tk main thread; engine
+    events are emitted on it too. If the timerfd cannot be created, the
+    scheduler's worker thread is used instead.
+    """
+
+    def __init__(self, root, scheduler):
+        self.root = root
+        self.scheduler = scheduler
+        self.timerfd = None
+        self.deadline = None
+        self.fallback = False  # Running on the scheduler's worker thread
+
+    def start(self):
+        """Create the timerfd and register it with Tk"""
+        if self.timerfd is not None or self.fallback:
+            return
+        try:
+            self.timerfd = TimerFD()
+        except Exception as e:
+            print(f"Error creating timerfd, using the scheduler thread: {e}")
+            self.fallback = True
+            self.scheduler.start()
+            return
+        self.root.tk.createfilehandler(self.timerfd.fileno(), tk.READABLE, self.on_readable)
+
+    def send(self, command):
+        """Apply a command immediately and re-arm the timer"""
+        if self.fallback:
+            self.scheduler.send(command)
+            return
+        self.arm(self.scheduler.safe_step(command))
+
+    def arm(self, deadline):
+        self.deadline = deadline
+        self.timerfd.arm(deadline)
+
+    def on_readable(self, fd, mask):
+        """Tk file handler: the deadline has passed"""
+        if not self.timerfd.read() or self.deadline is None:
+            return
+        self.scheduler.lateness.add(self.scheduler.clock.monotonic() - self.deadline)
+        self.arm(self.scheduler.safe_step())
+
+    def stop(self, timeout=1.0):
+        """Unregister and close the timerfd"""
+        if self.fallback:
+            self.scheduler.stop(timeout)
+        elif self.timerfd is not None:
+            self.root.tk.deletefilehandler(self.timerfd.fileno())
+            self.timerfd.close()
+            self.timerfd = None
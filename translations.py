@@ -1,182 +1,36 @@
-translations = {
-    "en": {
-        "app_title": "Pomodoro Timer",
-        "work_session": "WORK SESSION",
-        "break_session": "BREAK SESSION",
-        "long_break_session": "LONG BREAK",
-        "sessions": "Sessions",
-        "start": "Start",
-        "pause": "Pause",
-        "reset": "Reset",
-        "settings": "Settings",
-        "theme": "Theme:",
-        "volume": "Volume:",
-        "language": "Language:",
-        "shortcuts": "Keyboard Shortcuts: Space (Start/Pause), R (Reset)",
-        "session_complete": "Session Complete!",
-        "take_break": "Time to take a break!",
-        "back_to_work": "Time to get back to work!"
-    },
-    "fr": {
-        "app_title": "Minuteur Pomodoro",
-        "work_session": "SESSION DE TRAVAIL",
-        "break_session": "PAUSE",
-        "long_break_session": "LONGUE PAUSE",
-        "sessions": "Sessions",
-        "start": "Démarrer",
-        "pause": "Pause",
-        "reset": "Réinitialiser",
-        "settings": "Paramètres",
-        "theme": "Thème :",
-        "volume": "Volume :",
-        "language": "Langue :",
-        "shortcuts": "Raccourcis clavier : Espace (Démarrer/Pause), R (Réinitialiser)",
-        "session_complete": "Session terminée !",
-        "take_break": "C'est l'heure de la pause !",
-        "back_to_work": "C'est l'heure de reprendre le travail !"
-    },
-    "de": {
-        "app_title": "Pomodoro Timer",
-        "work_session": "ARBEITSSITZUNG",
-        "break_session": "PAUSE",
-        "long_break_session": "LANGE PAUSE",
-        "sessions": "Sitzungen",
-        "start": "Start",
-        "pause": "Pause",
-        "reset": "Zurücksetzen",
-        "settings": "Einstellungen",
-        "theme": "Thema:",
-        "volume": "Lautstärke:",
-        "language": "Sprache:",
-        "shortcuts": "Tastenkombinationen: Leertaste (Start/Pause), R (Zurücksetzen)",
-        "session_complete": "Sitzung beendet!",
-        "take_break": "Zeit für eine Pause!",
-        "back_to_work": "Zeit, wieder an die Arbeit zu gehen!"
-    },
-    "ar": {
-        "app_title": "مؤقت بومودورو",
-        "work_session": "جلسة العمل",
-        "break_session": "استراحة",
-        "long_break_session": "استراحة طويلة",
-        "sessions": "الجلسات",
-        "start": "بدء",
-        "pause": "إيقاف مؤقت",
-        "reset": "إعادة تعيين",
-        "settings": "الإعدادات",
-        "theme": "السمة:",
-        "volume": "الصوت:",
-        "language": "اللغة:",
-        "shortcuts": "اختصارات لوحة المفاتيح: مسافة (بدء/إيقاف مؤقت)، R (إعادة تعيين)",
-        "session_complete": "اكتملت الجلسة!",
-        "take_break": "حان وقت الاستراحة!",
-        "back_to_work": "حان وقت العودة إلى العمل!"
-    },
-    "es": {
-        "app_title": "Temporizador Pomodoro",
-        "work_session": "SESIÓN DE TRABAJO",
-        "break_session": "PAUSA",
-        "long_break_session": "PAUSA LARGA",
-        "sessions": "Sesiones",
-        "start": "Iniciar",
-        "pause": "Pausar",
-        "reset": "Reiniciar",
-        "settings": "Ajustes",
-        "theme": "Tema:",
-        "volume": "Volumen:",
-        "language": "Idioma:",
-        "shortcuts": "Atajos de teclado: Espacio (Iniciar/Pausar), R (Reiniciar)",
-        "session_complete": "¡Sesión completada!",
-        "take_break": "¡Hora de tomar un descanso!",
-        "back_to_work": "¡Hora de volver al trabajo!"
-    },
-    "it": {
-        "app_title": "Timer Pomodoro",
-        "work_session": "SESSIONE DI LAVORO",
-        "break_session": "PAUSA",
-        "long_break_session": "PAUSA LUNGA",
-        "sessions": "Sessioni",
-        "start": "Avvia",
-        "pause": "Pausa",
-        "reset": "Reimposta",
-        "settings": "Impostazioni",
-        "theme": "Tema:",
-        "volume": "Volume:",
-        "language": "Lingua:",
-        "shortcuts": "Scorciatoie: Spazio (Avvia/Pausa), R (Reimposta)",
-        "session_complete": "Sessione completata!",
-        "take_break": "È ora di fare una pausa!",
-        "back_to_work": "È ora di tornare al lavoro!"
-    },
-    "pt": {
-        "app_title": "Temporizador Pomodoro",
-        "work_session": "SESSÃO DE TRABALHO",
-        "break_session": "PAUSA",
-        "long_break_session": "PAUSA LONGA",
-        "sessions": "Sessões",
-        "start": "Iniciar",
-        "pause": "Pausar",
-        "reset": "Reiniciar",
-        "settings": "Configurações",
-        "theme": "Tema:",
-        "volume": "Volume:",
-        "language": "Idioma:",
-        "shortcuts": "Atalhos: Espaço (Iniciar/Pausar), R (Reiniciar)",
-        "session_complete": "Sessão concluída!",
-        "take_break": "Hora de fazer uma pausa!",
-        "back_to_work": "Hora de voltar ao trabalho!"
-    },
-    "ru": {
-        "app_title": "Таймер Помодоро",
-        "work_session": "РАБОЧАЯ СЕССИЯ",
-        "break_session": "ПЕРЕРЫВ",
-        "long_break_session": "ДЛИННЫЙ ПЕРЕРЫВ",
-        "sessions": "Сессии",
-        "start": "Старт",
-        "pause": "Пауза",
-        "reset": "Сброс",
-        "settings": "Настройки",
-        "theme": "Тема:",
-        "volume": "Громкость:",
-        "language": "Язык:",
-        "shortcuts": "Горячие клавиши: Пробел (Старт/Пауза), R (Сброс)",
-        "session_complete": "Сессия завершена!",
-        "take_break": "Время сделать перерыв!",
-        "back_to_work": "Время возвращаться к работе!"
-    },
-    "zh": {
-        "app_title": "番茄计时器",
-        "work_session": "工作阶段",
-        "break_session": "休息时间",
-        "long_break_session": "长休息",
-        "sessions": "阶段",
-        "start": "开始",
-        "pause": "暂停",
-        "reset": "重置",
-        "settings": "设置",
-        "theme": "主题：",
-        "volume": "音量：",
-        "language": "语言：",
-        "shortcuts": "快捷键：空格键（开始/暂停），R（重置）",
-        "session_complete": "阶段完成！",
-        "take_break": "该休息了！",
-        "back_to_work": "该回去工作了！"
-    },
-    "ja": {
-        "app_title": "ポモドーロタイマー",
-        "work_session": "作業セッション",
-        "break_session": "休憩",
-        "long_break_session": "長休憩",
-        "sessions": "セッション",
-        "start": "開始",
-        "pause": "一時停止",
-        "reset": "リセット",
-        "settings": "設定",
-        "theme": "テーマ：",
-        "volume": "音量：",
-        "language": "言語：",
-        "shortcuts": "ショートカット：スペース（開始/一時停止）、R（リセット）",
-        "session_complete": "セッション完了！",
-        "take_break": "休憩時間です！",
-        "back_to_work": "作業に戻る時間です！"
-    }
-}
+"""UI strings by language code.
+
+Each language lives in its own ``locales/<code>.py`` module and is only
+imported the first time it is looked up, so startup loads just the active
+language. ``translations[code][key]`` works as with a plain dict.
+"""
+
+import importlib
+from collections.abc import Mapping
+
+DEFAULT_LANGUAGE = "en"
+LANGUAGES = ("en", "fr", "de", "ar", "es", "it", "pt", "ru", "zh", "ja")
+
+
+class Translations(Mapping):
+    """Read-only mapping of language code to strings, loaded on demand"""
+
+    def __init__(self, languages=LANGUAGES):
+        self.languages = languages
+        self.loaded = {}
+
+    def __getitem__(self, language):
+        if language not in self.loaded:
+            if language not in self.languages:
+                raise KeyError(language)
+            self.loaded[language] = importlib.import_module(f"locales.{language}").strings
+        return self.loaded[language]
+
+    def __iter__(self):
+        return iter(self.languages)
+
+    def __len__(self):
+        return len(self.languages)
+
+
+translations = Translations()
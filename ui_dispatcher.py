@@ -0,0 +1,133 @@
+"""Coalescing UI update dispatcher.
+
+Widget updates may be requested from any thread. They are merged per
+widget and applied by a single Tk callback per frame on the main thread,
+and options whose value has not changed since they were last applied are
+skipped, so an unchanged label is never reconfigured (and re-laid-out).
+
+While the window is hidden, updates are only recorded; a single catch-up
+render is done when it is shown again.
+"""
+
+import threading
+
+# Delay before a batch of pending updates is applied, in milliseconds
+FRAME_MS = 16
+
+
+class UIDispatcher:
+    """Batch ``widget.configure`` calls into one Tk callback per frame.
+
+    Widgets updated through the dispatcher should not be configured
+    directly elsewhere, otherwise the last-applied cache goes stale.
+    """
+
+    def __init__(self, root, frame_ms=FRAME_MS):
+        self.root = root
+        self.frame_ms = frame_ms
+        self.lock = threading.Lock()
+        self.pending = {}   # widget -> options to apply
+        self.calls = []     # callables to run after the configures
+        self.applied = {}   # widget -> options last applied
+        self.scheduled = False
+        self.visible = True
+
+        # Instrumentation
+        self.flushes = 0
+        self.updates_applied = 0
+        self.updates_skipped = 0
+
+    def configure(self, widget, **options):
+        """Queue a configure of ``widget``; safe to call from any thread"""
+        with self.lock:
+            self.pending.setdefault(widget, {}).update(options)
+            self._schedule()
+
+    def call(self, func):
+        """Queue ``func`` to run on the main thread with the next batch"""
+        with self.lock:
+            self.calls.append(func)
+            self._schedule()
+
+    def set_visible(self, visible):
+        """Stop rendering while hidden; render pending updates when shown"""
+        with self.lock:
+            self.visible = visible
+            if visible and (self.pending or self.calls):
+                self._schedule()
+
+    def forget(self, widget=None):
+        """Drop the cached state of ``widget``, or of all widgets (e.g. after
+        a theme change restyled them)"""
+        with self.lock:
+            if widget is None:
+                self.applied.clear()
+            else:
+                self.applied.pop(widget, None)
+
+    def _schedule(self):
+        # Must be called with the lock held
+        if self.visible and not self.scheduled:
+            self.scheduled = True
+            self.root.after(self.frame_ms, self.flush)
+
+    def flush(self):
+        """Apply all pending updates (main thread only)"""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            calls, self.calls = self.calls, []
+            self.scheduled = False
+        self.flushes += 1
+
+        for widget, options in pending.items():
+            applied = self.applied.setdefault(widget, {})
+            changed = {
+                key: value for key, value in options.items()
+                if key not in applied or applied[key] != value
+            }
+            self.updates_skipped += len(options) - len(changed)
+            if changed:
+                widget.configure(**changed)
+                applied.update(changed)
+                self.updates_applied += len(changed)
+
+        for func in calls:
+            func()
+
+
+class PixelProgress:
+    """Decide when a progress bar actually moves.
+
+    For a bar ``width`` pixels wide showing ``elapsed`` of ``duration``
+    seconds, ``update`` returns the new bar value only when the filled part
+    grows or shrinks by at least one pixel, and ``None`` otherwise, so the
+    bar is redrawn at most once per visible pixel. Call ``resize`` from the
+    bar's ``<Configure>`` handler.
+    """
+
+    def __init__(self, width=1):
+        self.lock = threading.Lock()
+        self.width = max(1, width)
+        self.duration = None
+        self.pixel = None
+        self.low = 0    # Elapsed seconds at which the current pixel starts
+        self.high = 0   # Elapsed seconds at which the next pixel starts
+
+    def resize(self, width):
+        """The bar changed size; the next update always renders"""
+        with self.lock:
+            self.width = max(1, width)
+            self.pixel = None
+
+    def update(self, elapsed, duration):
+        """New bar value (0-100) if the bar moves, else ``None``"""
+        with self.lock:
+            if duration == self.duration and self.pixel is not None and self.low <= elapsed < self.high:
+                return None
+            pixel = elapsed * self.width // duration
+            changed = pixel != self.pixel or duration != self.duration
+            self.duration = duration
+            self.pixel = pixel
+            self.low = -(-pixel * duration // self.width)
+            self.high = -(-(pixel + 1) * duration // self.width)
+            return pixel * 100 / self.width if changed else None